@@ -0,0 +1,21 @@
+// Switches a network tab between the plotly figure and the browser layout.
+//
+// With BROWSER_LAYOUT, pair networks arrive in the view store as cytoscape
+// elements seeded with the group's positions ({elements, layout, title}) and
+// cytoscape.js runs the force-directed layout here, in the browser. Every other
+// view is a plotly figure, drawn by `network.highlight` (assets/highlight.js).
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    cytoscape: {
+        render: function (view) {
+            const noUpdate = window.dash_clientside.no_update;
+            const hidden = {display: "none"};
+            if (view && view.elements) {
+                return [hidden, {}, view.elements, view.layout, view.title];
+            }
+            if (view && view.figure) {
+                return [{}, hidden, noUpdate, noUpdate, noUpdate];
+            }
+            return [noUpdate, noUpdate, noUpdate, noUpdate, noUpdate];
+        },
+    },
+});
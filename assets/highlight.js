@@ -0,0 +1,81 @@
+// Highlights the selected authors on a network figure in the browser.
+//
+// The server sends a view ({figure, highlight}) only when the node set changes;
+// `highlight` is set for group and journal figures, on which selected authors
+// are highlighted here. The nodes are found by their name key (first and last
+// name, lowercased, as in `datasets.name_key`) in the node trace, which is
+// always the figure's last trace; the index is built once per view from the
+// trace's hovertext. Selecting or swapping authors then only copies the node
+// colors and labels and rewrites the focused entries: the edge arrays are
+// reused as is and nothing is requested from the server.
+//
+// Colors and the ** label markers match `graphing.build_network`; compact
+// figures color nodes with 0/1 through a two-color scale instead.
+const NODE_COLOR = "#000000";
+const FOCUS_COLOR = "#ff0000";
+
+// name key to node position, per view (a new view is sent with every figure)
+const indexes = new WeakMap();
+
+function nameKey(name) {
+    const parts = name.trim().split(/\s+/);
+    return (parts[0] + " " + parts[parts.length - 1]).toLowerCase();
+}
+
+function nodeIndex(view, figure) {
+    let index = indexes.get(view);
+    if (!index) {
+        index = {};
+        figure.data[figure.data.length - 1].hovertext.forEach(function (name, i) {
+            index[nameKey(name.startsWith("**") ? name.slice(2, -2) : name)] = i;
+        });
+        indexes.set(view, index);
+    }
+    return index;
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    network: {
+        highlight: function (view, author1, author2, team, current) {
+            const noUpdate = window.dash_clientside.no_update;
+            const fromServer = window.dash_clientside.callback_context.triggered.some(
+                function (t) {
+                    return t.prop_id.endsWith(".data");
+                }
+            );
+            const base = fromServer && view && view.figure ? view.figure : current;
+            if (!view || !view.highlight || !base) {
+                return base === current ? noUpdate : base;
+            }
+            const index = nodeIndex(view, base);
+            const data = base.data.slice();
+            const last = data.length - 1;
+            const nodes = Object.assign({}, data[last]);
+            const color = nodes.marker.color.slice();
+            const numeric = typeof color[0] === "number";
+            const nodeColor = numeric ? 0 : NODE_COLOR;
+            const focusColor = numeric ? 1 : FOCUS_COLOR;
+            const hovertext = nodes.hovertext.slice();
+            for (let i = 0; i < hovertext.length; i++) {
+                if (hovertext[i].startsWith("**")) {
+                    hovertext[i] = hovertext[i].slice(2, -2);
+                    color[i] = nodeColor;
+                }
+            }
+            [author1, author2].concat(team || []).forEach(function (author) {
+                if (!author) {
+                    return;
+                }
+                const i = index[nameKey(author)];
+                if (i !== undefined) {
+                    hovertext[i] = "**" + hovertext[i] + "**";
+                    color[i] = focusColor;
+                }
+            });
+            nodes.marker = Object.assign({}, nodes.marker, {color: color});
+            nodes.hovertext = hovertext;
+            data[last] = nodes;
+            return Object.assign({}, base, {data: data});
+        },
+    },
+});
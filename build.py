@@ -0,0 +1,526 @@
+"""Builds all of the data served by the app.
+
+Each stage's output is cached under `.build/<stage>/<key>`, where the key is a
+content hash of the stage's inputs and parameters, so unchanged stages are
+skipped and only the affected groups are rebuilt after a csv change.
+
+Stages:
+    ingest      load each scraped publications file
+    identity    resolve author names to canonical graph nodes
+    dedup       keep one record per publication, with where it was scraped
+    edges       aggregate weighted edges and the journal index in one pass
+    members     resolve each group's scholars to graph nodes
+    counts      write the coauthor counts table
+    layout      spring_layout positions of each group, warm-started from the
+                published positions
+    metrics     network metrics of each group
+    overlap     sparse shared coauthor matrix of each group's scholars
+    figure      pre-serialized figure of each group network
+    serving     member graph and adjacency index loaded by the app
+
+Groups build in parallel, the results are then published to `data/`.
+
+Usage:
+    python build.py [--jobs N] [--datasets cop ipop ...] [--force]
+"""
+
+import argparse
+import filecmp
+import itertools
+import json
+import os
+import pickle
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Union
+
+import networkx as nx
+
+from utils import (
+    adjacency,
+    aggregation,
+    datasets,
+    graphing,
+    journals,
+    layout,
+    metrics,
+    overlap,
+    pipeline,
+    utils,
+)
+
+VERSIONS = {
+    "ingest": 1,
+    "identity": 1,
+    "dedup": 1,
+    "edges": 2,
+    "members": 1,
+    "counts": 1,
+    "serving": 1,
+    "layout": 3,
+    "metrics": 1,
+    "overlap": 1,
+    "figure": 2,
+}
+
+
+def _dump(obj, fpath: str):
+    with open(fpath, "wb") as f:
+        pickle.dump(obj, f)
+
+
+def _load(fpath: str):
+    with open(fpath, "rb") as f:
+        return pickle.load(f)
+
+
+@lru_cache(maxsize=None)
+def _graph(edges_dir: str) -> nx.Graph:
+    return utils.load_graph(os.path.join(edges_dir, "full_graph.pkl"))
+
+
+def _members(members_dir: str) -> set[str]:
+    with open(os.path.join(members_dir, "members.json"), "r") as f:
+        return set(json.load(f))
+
+
+def stage_ingest(out: str, fpath: str):
+    """Loads a scraped publications file."""
+    _dump(aggregation.load_publications(fpath), os.path.join(out, "publications.pkl"))
+
+
+def stage_identity(out: str, ingest_dirs: list[str]):
+    """Resolves the author names of every publication."""
+    publications = itertools.chain.from_iterable(
+        _load(os.path.join(d, "publications.pkl")) for d in ingest_dirs
+    )
+    _dump(aggregation.resolve_authors(publications), os.path.join(out, "records.pkl"))
+
+
+def stage_dedup(out: str, identity_dir: str, ingest_dirs: list[str], fpaths: list[str]):
+    """Deduplicates the resolved publications and records their provenance."""
+    sources = [
+        (os.path.basename(fpath), i)
+        for fpath, d in zip(fpaths, ingest_dirs)
+        for i in range(len(_load(os.path.join(d, "publications.pkl"))))
+    ]
+    records, provenance = aggregation.dedupe_records(
+        _load(os.path.join(identity_dir, "records.pkl")), sources
+    )
+    _dump(records, os.path.join(out, "records.pkl"))
+    with open(os.path.join(out, "provenance.json"), "w") as f:
+        json.dump(provenance, f)
+    with open(os.path.join(out, "dedup.json"), "w") as f:
+        json.dump({"records": len(sources), "publications": len(records)}, f)
+
+
+def stage_edges(out: str, dedup_dir: str):
+    """Aggregates the weighted base graph and the journal index."""
+    graph, journal_index = aggregation.aggregate_edges(
+        _load(os.path.join(dedup_dir, "records.pkl"))
+    )
+    utils.save_graph(graph, os.path.join(out, "full_graph.pkl"))
+    journal_index.save(os.path.join(out, "journal-index.pkl"))
+
+
+def stage_members(out: str, config: datasets.DatasetConfig, edges_dir: str):
+    """Resolves a group's scholars to graph nodes."""
+    members = datasets.resolve_members(
+        datasets.load_scholar_names(config), datasets.node_keys(_graph(edges_dir))
+    )
+    with open(os.path.join(out, "members.json"), "w") as f:
+        json.dump(sorted(members), f, indent=2)
+
+
+def stage_counts(out: str, edges_dir: str, members_dirs: list[str]):
+    """Writes the coauthor counts table of all groups."""
+    members = set().union(*(_members(d) for d in members_dirs))
+    aggregation.write_coauthor_counts(
+        _graph(edges_dir), members, os.path.join(out, "coauthor_counts.csv")
+    )
+
+
+def stage_serving(out: str, edges_dir: str, members_dirs: list[str]):
+    """Splits the base graph into the member graph and the adjacency index."""
+    graph = _graph(edges_dir)
+    members = set().union(*(_members(d) for d in members_dirs))
+    utils.save_graph(
+        datasets.member_graph(graph, members), os.path.join(out, "member-graph.pkl")
+    )
+    adjacency.AdjacencyIndex.from_graph(graph).save(os.path.join(out, "adjacency.npz"))
+
+
+def stage_layout(
+    out: str,
+    edges_dir: str,
+    members_dir: str,
+    seed: int,
+    previous_file: Union[str, None],
+    iterations: int,
+):
+    """Lays out a group's network, warm-started from previous positions."""
+    graph = datasets.group_view(_graph(edges_dir), _members(members_dir))
+    previous = utils.load_positions(previous_file) if previous_file else None
+    positions = layout.warm_layout(graph, previous, iterations, seed)
+    _dump(positions, os.path.join(out, "positions.pkl"))
+    if previous:
+        with open(os.path.join(out, "displacement.json"), "w") as f:
+            json.dump(layout.displacement(previous, positions), f, indent=2)
+
+
+def stage_metrics(out: str, edges_dir: str, members_dir: str):
+    """Computes a group's network metrics."""
+    members = _members(members_dir)
+    graph = datasets.group_view(_graph(edges_dir), members)
+    with open(os.path.join(out, "metrics.json"), "w") as f:
+        json.dump(metrics.group_metrics(graph, members), f, indent=2)
+
+
+def stage_overlap(out: str, edges_dir: str, members_dir: str):
+    """Computes the shared coauthor matrix of a group's scholars."""
+    overlap.Overlap.from_graph(_graph(edges_dir), _members(members_dir)).save(
+        os.path.join(out, "overlap.npz")
+    )
+
+
+def stage_figure(
+    out: str,
+    config: datasets.DatasetConfig,
+    edges_dir: str,
+    members_dir: str,
+    layout_dir: str,
+):
+    """Pre-serializes the figure of a group's entire network."""
+    graph = datasets.group_view(_graph(edges_dir), _members(members_dir))
+    positions = utils.load_positions(os.path.join(layout_dir, "positions.pkl"))
+    fig = datasets.group_figure(graph, positions, config.label)
+    payload = graphing.figure_json(fig)
+    with open(os.path.join(out, "figure.json"), "w") as f:
+        f.write(payload)
+    with open(os.path.join(out, "sizes.json"), "w") as f:
+        json.dump(graphing.payload_sizes(graph, positions, payload), f, indent=2)
+
+
+def members_key(
+    cache: pipeline.StageCache, config: datasets.DatasetConfig, edges_key: str
+) -> str:
+    """Content key of a group's members stage."""
+    return cache.key(
+        "members",
+        VERSIONS["members"],
+        params={"name_fields": config.name_fields},
+        inputs=(config.scholars_file,),
+        upstream=(edges_key,),
+    )
+
+
+def group_digests(edges_dir: str, *members_dirs: str) -> tuple[str, ...]:
+    """Content digests of the base graph and of resolved member lists."""
+    return (
+        pipeline.file_digest(os.path.join(edges_dir, "full_graph.pkl")),
+        *(
+            pipeline.file_digest(os.path.join(members_dir, "members.json"))
+            for members_dir in members_dirs
+        ),
+    )
+
+
+def build_group(
+    cache: pipeline.StageCache,
+    config: datasets.DatasetConfig,
+    edges_key: str,
+    seed: int,
+    iterations: int = layout.WARM_ITERATIONS,
+    cold: bool = False,
+) -> dict[str, str]:
+    """Runs the per-group stages of one dataset.
+
+    The stages after `members` are keyed by the contents of the base graph
+    and of the resolved member list rather than by their stage keys, so an
+    edit to a scholars csv that resolves to the same members, or a change
+    that only touches the journal index, skips them. The layout is keyed by
+    the group's graph only, so it is recomputed when the graph changes,
+    warm-started from the currently published positions.
+
+    Args:
+        cache (pipeline.StageCache): stage cache.
+        config (datasets.DatasetConfig): group to build.
+        edges_key (str): key of the edges stage.
+        seed (int): spring_layout seed.
+        iterations (int, optional): spring_layout iterations of a warm start.
+            Defaults to layout.WARM_ITERATIONS.
+        cold (bool, optional): ignore the published positions. Defaults to False.
+
+    Returns:
+        dict[str, str]: stage name to content key.
+    """
+    edges_dir = cache.path("edges", edges_key)
+    keys = {}
+    keys["members"] = members_key(cache, config, edges_key)
+    members_dir = cache.path("members", keys["members"])
+    report(
+        config.label,
+        "members",
+        cache.run("members", keys["members"], stage_members, config, edges_dir),
+    )
+    group = group_digests(edges_dir, members_dir)
+
+    previous_file = None
+    if not cold and os.path.exists(config.positions_file):
+        previous_file = config.positions_file
+    keys["layout"] = cache.key(
+        "layout",
+        VERSIONS["layout"],
+        params={"seed": seed, "iterations": iterations, "cold": cold},
+        upstream=group,
+    )
+    layout_dir = cache.path("layout", keys["layout"])
+    ran = cache.run(
+        "layout",
+        keys["layout"],
+        stage_layout,
+        edges_dir,
+        members_dir,
+        seed,
+        previous_file,
+        iterations,
+    )
+    report(config.label, "layout", ran)
+    displacement_file = os.path.join(layout_dir, "displacement.json")
+    if ran and os.path.exists(displacement_file):
+        with open(displacement_file, "r") as f:
+            moved = json.load(f)
+        print(
+            f"{config.label:>8} {'':<10} {moved['kept']} nodes kept "
+            f"(moved mean {moved.get('mean', 0):.3f}, p95 {moved.get('p95', 0):.3f}, "
+            f"max {moved.get('max', 0):.3f}), {moved['new']} new, "
+            f"{moved['removed']} removed",
+            flush=True,
+        )
+
+    keys["metrics"] = cache.key("metrics", VERSIONS["metrics"], upstream=group)
+    report(
+        config.label,
+        "metrics",
+        cache.run("metrics", keys["metrics"], stage_metrics, edges_dir, members_dir),
+    )
+
+    keys["overlap"] = cache.key("overlap", VERSIONS["overlap"], upstream=group)
+    report(
+        config.label,
+        "overlap",
+        cache.run("overlap", keys["overlap"], stage_overlap, edges_dir, members_dir),
+    )
+
+    keys["figure"] = cache.key(
+        "figure",
+        VERSIONS["figure"],
+        params={
+            "label": config.label,
+            "compact": graphing.COMPACT,
+            "typed_arrays": graphing.TYPED_ARRAYS,
+        },
+        upstream=(*group, keys["layout"]),
+    )
+    report(
+        config.label,
+        "figure",
+        cache.run(
+            "figure",
+            keys["figure"],
+            stage_figure,
+            config,
+            edges_dir,
+            members_dir,
+            layout_dir,
+        ),
+    )
+    with open(os.path.join(cache.path("figure", keys["figure"]), "sizes.json")) as f:
+        sizes = json.load(f)
+    print(
+        f"{config.label:>8} {'':<10} figure {sizes['full']:,} bytes as plain json, "
+        f"{sizes['served']:,} served ({sizes['full'] / sizes['served']:.1f}x smaller), "
+        f"{sizes['served_gzip']:,} gzipped",
+        flush=True,
+    )
+    return keys
+
+
+def report(name: str, stage: str, ran: bool):
+    """Prints whether a stage ran or was served from the cache."""
+    print(f"{name:>8} {stage:<10} {'built' if ran else 'cached'}", flush=True)
+
+
+def publish(src: str, dest: str):
+    """Copies a stage output into `data/` if it differs from the current file."""
+    if os.path.exists(dest) and filecmp.cmp(src, dest, shallow=False):
+        return
+    shutil.copyfile(src, dest)
+    print(f"published {dest}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        choices=[config.key for config in datasets.DATASETS],
+        default=[config.key for config in datasets.DATASETS],
+        help="groups to build, the coauthor counts always cover all groups",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    parser.add_argument("--cache-dir", default=pipeline.CACHE_DIR)
+    parser.add_argument("--seed", type=int, default=0, help="spring_layout seed")
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=layout.WARM_ITERATIONS,
+        help="spring_layout iterations when warm-started from published positions",
+    )
+    parser.add_argument(
+        "--cold", action="store_true", help="lay out from scratch, not warm-started"
+    )
+    parser.add_argument("--force", action="store_true", help="rebuild every stage")
+    args = parser.parse_args()
+
+    cache = pipeline.StageCache(args.cache_dir, force=args.force)
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        ingest_keys = [
+            cache.key("ingest", VERSIONS["ingest"], inputs=(fpath,))
+            for fpath in datasets.PUBLICATION_FILES
+        ]
+        for fpath, ran in zip(
+            datasets.PUBLICATION_FILES,
+            pool.map(
+                cache.run,
+                itertools.repeat("ingest"),
+                ingest_keys,
+                itertools.repeat(stage_ingest),
+                datasets.PUBLICATION_FILES,
+            ),
+        ):
+            report(os.path.basename(fpath), "ingest", ran)
+
+        identity_key = cache.key(
+            "identity", VERSIONS["identity"], upstream=tuple(ingest_keys)
+        )
+        report(
+            "all",
+            "identity",
+            cache.run(
+                "identity",
+                identity_key,
+                stage_identity,
+                [cache.path("ingest", key) for key in ingest_keys],
+            ),
+        )
+
+        dedup_key = cache.key("dedup", VERSIONS["dedup"], upstream=(identity_key,))
+        dedup_dir = cache.path("dedup", dedup_key)
+        report(
+            "all",
+            "dedup",
+            cache.run(
+                "dedup",
+                dedup_key,
+                stage_dedup,
+                cache.path("identity", identity_key),
+                [cache.path("ingest", key) for key in ingest_keys],
+                datasets.PUBLICATION_FILES,
+            ),
+        )
+        with open(os.path.join(dedup_dir, "dedup.json"), "r") as f:
+            dedup = json.load(f)
+        duplicates = dedup["records"] - dedup["publications"]
+        print(
+            f"{'':>8} {'':<10} {dedup['records']} records, {dedup['publications']} "
+            f"publications, {duplicates} duplicates "
+            f"({duplicates / max(dedup['records'], 1):.1%})",
+            flush=True,
+        )
+
+        edges_key = cache.key("edges", VERSIONS["edges"], upstream=(dedup_key,))
+        edges_dir = cache.path("edges", edges_key)
+        report("all", "edges", cache.run("edges", edges_key, stage_edges, dedup_dir))
+
+        configs = [
+            config for config in datasets.DATASETS if config.key in args.datasets
+        ]
+        group_keys = dict(
+            zip(
+                [config.key for config in configs],
+                pool.map(
+                    build_group,
+                    itertools.repeat(cache),
+                    configs,
+                    itertools.repeat(edges_key),
+                    itertools.repeat(args.seed),
+                    itertools.repeat(args.iterations),
+                    itertools.repeat(args.cold),
+                ),
+            )
+        )
+
+    members_keys = []
+    for config in datasets.DATASETS:
+        if config.key in group_keys:
+            members_keys.append(group_keys[config.key]["members"])
+        else:
+            key = members_key(cache, config, edges_key)
+            cache.run("members", key, stage_members, config, edges_dir)
+            members_keys.append(key)
+    members_dirs = [cache.path("members", key) for key in members_keys]
+    all_groups = group_digests(edges_dir, *members_dirs)
+    counts_key = cache.key("counts", VERSIONS["counts"], upstream=all_groups)
+    report(
+        "all",
+        "counts",
+        cache.run(
+            "counts",
+            counts_key,
+            stage_counts,
+            edges_dir,
+            members_dirs,
+        ),
+    )
+    serving_key = cache.key("serving", VERSIONS["serving"], upstream=all_groups)
+    serving_dir = cache.path("serving", serving_key)
+    report(
+        "all",
+        "serving",
+        cache.run("serving", serving_key, stage_serving, edges_dir, members_dirs),
+    )
+
+    publish(os.path.join(edges_dir, "full_graph.pkl"), datasets.BASE_GRAPH_FILE)
+    publish(os.path.join(serving_dir, "member-graph.pkl"), datasets.MEMBER_GRAPH_FILE)
+    publish(os.path.join(serving_dir, "adjacency.npz"), datasets.ADJACENCY_FILE)
+    publish(os.path.join(edges_dir, "journal-index.pkl"), journals.JOURNAL_INDEX_FILE)
+    publish(
+        os.path.join(cache.path("counts", counts_key), "coauthor_counts.csv"),
+        aggregation.COAUTHOR_COUNTS_FILE,
+    )
+    for config in configs:
+        keys = group_keys[config.key]
+        publish(
+            os.path.join(cache.path("layout", keys["layout"]), "positions.pkl"),
+            config.positions_file,
+        )
+        publish(
+            os.path.join(cache.path("metrics", keys["metrics"]), "metrics.json"),
+            config.metrics_file,
+        )
+        publish(
+            os.path.join(cache.path("figure", keys["figure"]), "figure.json"),
+            config.figure_file,
+        )
+        publish(
+            os.path.join(cache.path("overlap", keys["overlap"]), "overlap.npz"),
+            config.overlap_file,
+        )
+
+
+if __name__ == "__main__":
+    main()
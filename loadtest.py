@@ -0,0 +1,458 @@
+"""Load tests the app's callback endpoint under gunicorn.
+
+For every combination of worker class and worker count, `main:server` is
+started under gunicorn on a local port and simulated users replay sessions
+(tab switches, author searches and selections, journal and hop filters, the
+overlap and data table tabs) against `/_dash-update-component`. Each session
+step posts the same payload the browser would send for that callback.
+
+Latency percentiles, throughput and errors are reported per callback and for
+the whole run, so worker settings can be compared on the same workload.
+
+Usage:
+    python loadtest.py [--worker-class sync gthread] [--workers 1 2 4]
+        [--threads 4] [--concurrency 8] [--duration 60]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Union
+
+import numpy as np
+
+from utils import datasets, journals
+
+CALLBACK_URL = "/_dash-update-component"
+# pause between the steps of a session, in seconds, as a user would
+THINK_TIME = (0.2, 1.0)
+
+
+def prop(component_id: str, component_property: str, value: Any = None) -> dict:
+    """Describes a component property the way dash-renderer posts it."""
+    return {"id": component_id, "property": component_property, "value": value}
+
+
+def payload(
+    outputs: list[tuple[str, str]],
+    inputs: list[dict],
+    state: Union[list[dict], None] = None,
+    changed: int = 0,
+) -> dict:
+    """Builds the request body of a callback call.
+
+    Args:
+        outputs (list[tuple[str, str]]): (component id, property) of each output.
+        inputs (list[dict]): input properties, in the callback's order.
+        state (Union[list[dict], None], optional): state properties. Defaults to None.
+        changed (int, optional): position of the input that changed. Defaults to 0.
+
+    Returns:
+        dict: json body for `/_dash-update-component`.
+    """
+    if len(outputs) == 1:
+        output = "{}.{}".format(*outputs[0])
+        described = {"id": outputs[0][0], "property": outputs[0][1]}
+    else:
+        output = "..{}..".format("...".join("{}.{}".format(*o) for o in outputs))
+        described = [{"id": i, "property": p} for i, p in outputs]
+    return {
+        "output": output,
+        "outputs": described,
+        "inputs": inputs,
+        "changedPropIds": [f"{inputs[changed]['id']}.{inputs[changed]['property']}"],
+        "state": state or [],
+    }
+
+
+class SessionFactory:
+    """Generates random but realistic sequences of callback calls."""
+
+    def __init__(self, seed: Union[int, None] = None):
+        self.random = random.Random(seed)
+        self.names = {
+            config.key: datasets.load_scholar_names(config)
+            for config in datasets.DATASETS
+        }
+        postings = journals.JournalIndex.load().postings
+        self.journals = sorted(postings, key=lambda key: -len(postings[key]))[:50]
+
+    def network_session(self, key: str) -> list[tuple[str, dict]]:
+        """Explores one group's network tab."""
+        names = self.names[key]
+        author1, author2 = self.random.sample(names, 2)
+        steps = [
+            (
+                "tab_content",
+                payload(
+                    [("main_content_body", "children")],
+                    [prop("card-tabs", "active_tab", f"tab-{key}")],
+                ),
+            ),
+            (
+                "author_options",
+                payload(
+                    [(f"{key}-author-dropdown1", "options")],
+                    [
+                        prop(f"{key}-author-dropdown1", "search_value", author1[:3]),
+                        prop(f"{key}-author-dropdown2", "value", ""),
+                    ],
+                    [prop(f"{key}-author-dropdown1", "value", "")],
+                ),
+            ),
+        ]
+        graph_inputs = [
+            prop(f"{key}-author-dropdown1", "value", ""),
+            prop(f"{key}-author-dropdown2", "value", ""),
+            prop(f"{key}-team-dropdown", "value", []),
+            prop(f"{key}-journal-dropdown", "value", []),
+            prop(f"{key}-depth-slider", "value", 1),
+            prop(f"{key}-view-radio", "value", "network"),
+        ]
+        changes = [(0, author1)]
+        if self.random.random() < 0.3:
+            changes.insert(0, (5, "highlight"))
+        if self.random.random() < 0.6:
+            changes.append((1, author2))
+        if self.random.random() < 0.1:
+            team = self.random.sample(
+                names, min(len(names), self.random.randint(3, 12))
+            )
+            changes.append((2, team))
+        if self.random.random() < 0.3:
+            changes.append((3, self.random.sample(self.journals, 2)))
+        if self.random.random() < 0.2:
+            changes.append((4, 2))
+        for changed, value in changes:
+            graph_inputs[changed] = dict(graph_inputs[changed], value=value)
+            steps.append(
+                (
+                    "draw_graph",
+                    payload(
+                        [(f"{key}-view-store", "data")],
+                        list(graph_inputs),
+                        changed=changed,
+                    ),
+                )
+            )
+        return steps
+
+    def table_session(self) -> list[tuple[str, dict]]:
+        """Filters the coauthor counts table on a COP scholar."""
+        return [
+            (
+                "tab_content",
+                payload(
+                    [("main_content_body", "children")],
+                    [prop("card-tabs", "active_tab", "tab-table")],
+                ),
+            ),
+            (
+                "update_options_table",
+                payload(
+                    [("table-card", "children")],
+                    [
+                        prop(
+                            "table-author-dropdown",
+                            "value",
+                            self.random.choice(self.names["cop"]),
+                        )
+                    ],
+                ),
+            ),
+        ]
+
+    def overlap_session(self) -> list[tuple[str, dict]]:
+        """Opens the overlap tab and looks up a scholar's colleagues."""
+        key = self.random.choice(list(self.names))
+        return [
+            (
+                "tab_content",
+                payload(
+                    [("main_content_body", "children")],
+                    [prop("card-tabs", "active_tab", "tab-overlap")],
+                ),
+            ),
+            (
+                "update_overlap_group",
+                payload(
+                    [
+                        ("overlap-graph", "figure"),
+                        ("overlap-author-dropdown", "options"),
+                        ("overlap-author-dropdown", "value"),
+                    ],
+                    [prop("overlap-dataset-dropdown", "value", key)],
+                ),
+            ),
+            (
+                "update_overlap_table",
+                payload(
+                    [("overlap-card", "children")],
+                    [
+                        prop(
+                            "overlap-author-dropdown",
+                            "value",
+                            self.random.choice(self.names[key]),
+                        )
+                    ],
+                    [prop("overlap-dataset-dropdown", "value", key)],
+                ),
+            ),
+        ]
+
+    def session(self) -> list[tuple[str, dict]]:
+        """Picks a random kind of session."""
+        roll = self.random.random()
+        if roll < 0.7:
+            return self.network_session(self.random.choice(list(self.names)))
+        if roll < 0.85:
+            return self.table_session()
+        return self.overlap_session()
+
+
+class Results:
+    """Thread-safe latency samples per callback."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, callback: str, seconds: float, ok: bool):
+        with self.lock:
+            self.latencies[callback].append(seconds)
+            if not ok:
+                self.errors[callback] += 1
+
+    def summary(self, elapsed: float) -> dict[str, dict[str, float]]:
+        """Latency percentiles (ms), throughput (req/s) and errors per callback.
+
+        Args:
+            elapsed (float): wall time of the run in seconds.
+
+        Returns:
+            dict[str, dict[str, float]]: callback name to its statistics, plus
+            an "all" entry.
+        """
+        rows = dict(self.latencies)
+        rows["all"] = list(itertools.chain.from_iterable(self.latencies.values()))
+        errors = dict(self.errors, all=sum(self.errors.values()))
+        summary = {}
+        for callback, samples in rows.items():
+            if not samples:
+                continue
+            p50, p95, p99 = np.percentile(np.array(samples) * 1000, [50, 95, 99])
+            summary[callback] = {
+                "requests": len(samples),
+                "errors": errors.get(callback, 0),
+                "p50_ms": p50,
+                "p95_ms": p95,
+                "p99_ms": p99,
+                "throughput": len(samples) / elapsed,
+            }
+        return summary
+
+
+def post(url: str, body: dict, timeout: float) -> bool:
+    """Posts a callback call, True if it answered 200 or 204."""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            return response.status in (200, 204)
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def user(
+    url: str,
+    factory: SessionFactory,
+    results: Results,
+    deadline: float,
+    think: bool,
+    timeout: float,
+):
+    """Replays sessions until the deadline."""
+    while time.monotonic() < deadline:
+        for callback, body in factory.session():
+            if time.monotonic() >= deadline:
+                return
+            start = time.perf_counter()
+            ok = post(url, body, timeout)
+            results.record(callback, time.perf_counter() - start, ok)
+            if think:
+                time.sleep(factory.random.uniform(*THINK_TIME))
+
+
+def start_server(
+    worker_class: str, workers: int, threads: int, port: int, timeout: float
+) -> subprocess.Popen:
+    """Starts gunicorn and waits until the app answers.
+
+    Raises:
+        RuntimeError: if gunicorn exits or does not answer within `timeout`.
+    """
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "main:server",
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--workers",
+        str(workers),
+        "--worker-class",
+        worker_class,
+        "--threads",
+        str(threads),
+        "--timeout",
+        str(int(timeout)),
+    ]
+    server = subprocess.Popen(
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5):
+                return server
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.5)
+    stop_server(server)
+    raise RuntimeError("gunicorn did not answer in time")
+
+
+def stop_server(server: subprocess.Popen):
+    """Stops gunicorn gracefully, killing it if it hangs."""
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def run(
+    url: str, concurrency: int, duration: float, think: bool, timeout: float, seed: int
+) -> dict[str, dict[str, float]]:
+    """Runs simulated users against a started server.
+
+    Args:
+        url (str): callback endpoint.
+        concurrency (int): simultaneous users.
+        duration (float): seconds to run for.
+        think (bool): pause between steps like a user would.
+        timeout (float): per request timeout in seconds.
+        seed (int): seed of the first user's sessions.
+
+    Returns:
+        dict[str, dict[str, float]]: `Results.summary` of the run.
+    """
+    results = Results()
+    deadline = time.monotonic() + duration
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for i in range(concurrency):
+            pool.submit(
+                user, url, SessionFactory(seed + i), results, deadline, think, timeout
+            )
+    return results.summary(time.perf_counter() - start)
+
+
+def print_summary(title: str, summary: dict[str, dict[str, float]]):
+    """Prints one run's statistics as a table."""
+    print(f"\n{title}")
+    print(
+        f"{'callback':<22} {'requests':>8} {'errors':>6} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'req/s':>7}"
+    )
+    for callback, row in sorted(summary.items(), key=lambda item: item[0] == "all"):
+        print(
+            f"{callback:<22} {row['requests']:>8} {row['errors']:>6} "
+            f"{row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f} {row['p99_ms']:>8.0f} "
+            f"{row['throughput']:>7.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--worker-class", nargs="+", default=["sync", "gthread"])
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2])
+    parser.add_argument(
+        "--threads", type=int, default=4, help="threads per gthread worker"
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="simulated users")
+    parser.add_argument("--duration", type=float, default=60, help="seconds per run")
+    parser.add_argument(
+        "--no-think", action="store_true", help="send steps back to back"
+    )
+    parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument(
+        "--timeout", type=float, default=120, help="startup and request timeout"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write every summary to this file")
+    args = parser.parse_args()
+
+    os.environ.pop("DEBUG", None)
+    report = []
+    for worker_class, workers in itertools.product(args.worker_class, args.workers):
+        threads = args.threads if worker_class == "gthread" else 1
+        title = f"{worker_class} workers={workers} threads={threads} users={args.concurrency}"
+        server = start_server(worker_class, workers, threads, args.port, args.timeout)
+        try:
+            summary = run(
+                f"http://127.0.0.1:{args.port}{CALLBACK_URL}",
+                args.concurrency,
+                args.duration,
+                not args.no_think,
+                args.timeout,
+                args.seed,
+            )
+        finally:
+            stop_server(server)
+        print_summary(title, summary)
+        report.append(
+            {
+                "worker_class": worker_class,
+                "workers": workers,
+                "threads": threads,
+                "concurrency": args.concurrency,
+                "summary": summary,
+            }
+        )
+
+    print(f"\n{'configuration':<40} {'req/s':>7} {'p95 ms':>8} {'errors':>6}")
+    for entry in report:
+        overall = entry["summary"].get("all", {})
+        name = (
+            f"{entry['worker_class']} x{entry['workers']} ({entry['threads']} threads)"
+        )
+        print(
+            f"{name:<40} {overall.get('throughput', 0):>7.1f} "
+            f"{overall.get('p95_ms', 0):>8.0f} {overall.get('errors', 0):>6}"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,204 +4,37 @@ import dash
 from dash import dcc
 from dash import html
 import plotly.graph_objects as go
-from dash.dependencies import Input, Output
-import networkx as nx
-import csv
+from dash.dependencies import ClientsideFunction, Input, Output, State
+from dash.exceptions import PreventUpdate
 import pandas as pd
 from dash import dash_table
 import dash_bootstrap_components as dbc
-import scholar_network
-import pickle
 
-from utils import graphing, utils
+from utils import api, cytoscape, datasets, memory
 from dotenv import load_dotenv
 import os
 
+try:
+    import dash_cytoscape as cyto
+except ImportError:  # optional, pair networks are then laid out on the server
+    cyto = None
+
 load_dotenv()
 
+# lay out pair networks in the browser rather than with spring_layout
+BROWSER_LAYOUT = os.getenv("BROWSER_LAYOUT") == "1" and cyto is not None
 
-def load_scholar_names_from_file() -> list[str]:
-    """Loads scholars from file.
-
-    Returns:
-        list[str]: A list of scholar names.
-    """
-    with open("data/COPscholars.csv", "r") as f:
-        csvreader = csv.DictReader(f)
-        authors = []
-        for row in csvreader:
-            authors.append(row.get("Name"))
-        return authors
-
-
-def load_ipop_scholar_names_from_file() -> list[str]:
-    """Loads, specifically, IPOP scholars from file.
-
-    Returns:
-        list[str]: List of IPOP scholar names.
-    """
-    with open("data/IPOP-Scholars.csv", "r") as f:
-        csvreader = csv.DictReader(f)
-        authors = []
-        for row in csvreader:
-            authors.append(row.get("Name"))
-        return authors
-
-
-def load_sure_scholar_names_from_file() -> list[str]:
-    """Loads, specifically, SURE scholars from file.
-
-    Returns:
-        list[str]: List of SURE scholar names.
-    """
-    with open("data/SUREscholars.csv", "r") as f:
-        csvreader = csv.DictReader(f)
-        authors = []
-        for row in csvreader:
-            authors.append(
-                row.get("First", "").strip() + " " + row.get("Last", "").strip()
-            )
-        return authors
-
-
-def create_cop_network_graph_figure():
-    """Creates entire network graph.
-
-    This function calls our utility and graphing functions
-    to generate the entire network once on page load.
-
-    Returns:
-        [go.Figure]: plotly figure representing drawn network.
-    """
-    graph, positions = utils.load_graph_from_files()
-    node_trace, edge_trace = graphing.build_network(graph, positions)
-    fig = graphing.draw_network(node_trace, edge_trace, title="COP Network Graph")
-    return fig
-
-
-def create_ipop_network_graph_figure():
-    """Creates entire network graph for IPOP scholars only.
-
-    This function calls our utility and graphing functions
-    to generate the entire network once on page load.
-
-    Returns:
-        [go.Figure]: plotly figure representing drawn network.
-    """
-    graph, positions = utils.load_ipop_graph_from_files()
-    node_trace, edge_trace = graphing.build_network(graph, positions)
-    fig = graphing.draw_network(node_trace, edge_trace, title="IPOP Network Graph")
-    return fig
-
-
-def create_sure_graph_figure():
-    """Creates entire network graph for POC scholars only.
-
-    This function calls our utility and graphing functions
-    to generate the entire network once on page load.
-
-    Returns:
-        [go.Figure]: plotly figure representing drawn network.
-    """
-    with open("data/sure-graph.pkl", "rb") as f:
-        graph = pickle.load(f)
-    with open("data/sure-pos.pkl", "rb") as f:
-        positions = pickle.load(f)
-    node_trace, edge_trace = graphing.build_network(graph, positions)
-    fig = graphing.draw_network(node_trace, edge_trace, title="SURE Network Graph")
-    return fig
-
-
-def parse_name(name: str) -> str:
-    """Extracts first and last parts of a name.
-
-    This could be first and last name or any variation.
-
-    Args:
-        name (str): String name to be parsed
-
-    Returns:
-        str: Extracted 2-part name.
-    """
-    parts = name.split()
-    parsed = f"{parts[0][0]} {parts[-1]}".title()
-    if parsed == "J Mcginty":
-        return "J McGinty"
-    return parsed
-
-
-def pair_graph(name1: str, name2: str) -> go.Figure:
-    """Draws a graph, given two scholars to filter the network on.
-
-    Args:
-        author1 (str): first scholar name to filter on
-        author2 (str): second scholar name to filter on
-
-    Returns:
-        go.Figure: drawn network graph
-    """
-    a1 = parse_name(name1) if name1 else None
-    a2 = parse_name(name2) if name2 else None
-    graph = scholar_network.build_graph(a1, a2)
-    print(name1, "--0-", name2)
-    print(graph.node_pairs())
-    # ! time consuming, re-looping over nodes
-    # ! also, try to just filter the pickled graph instead of recreating a new one
-    G = nx.Graph()
-    print(name1, "--1-", name2)
-    G.add_edges_from(graph.node_pairs())
-    print(name1, "--2-", name2)
-
-    positions = nx.spring_layout(G)
-    print(name1, "--3-", name2)
-
-    node_trace, edge_trace = graphing.build_network(G, positions, a1, a2)
-    fig = graphing.draw_network(
-        node_trace,
-        edge_trace,
-        title=f"{name1.title() if name1 else '...'} x {name2.title() if name2 else '...'} Network Graph",
-    )
-    return fig
-
-
-def pair_graph_sure(name1: str, name2: str) -> go.Figure:
-    """Draws a graph, given two scholars to filter the network on.
-
-    Args:
-        author1 (str): first scholar name to filter on
-        author2 (str): second scholar name to filter on
-
-    Returns:
-        go.Figure: drawn network graph
-    """
-    a1 = parse_name(name1) if name1 else None
-    a2 = parse_name(name2) if name2 else None
-    graph = scholar_network.build_graph(a1, a2, fpath="data/scraped_sure.json")
-    print(a1, "--0-", a2)
-    # ! time consuming, re-looping over nodes
-    # ! also, try to just filter the pickled graph instead of recreating a new one
-    G = nx.Graph()
-    print(a1, "--1-", a2)
-    G.add_edges_from(graph.node_pairs())
-    print(a1, "--2-", a2)
-
-    positions = nx.spring_layout(G)
-    print(a1, "--3-", a2)
-
-    node_trace, edge_trace = graphing.build_network(G, positions, a1, a2)
-    fig = graphing.draw_network(
-        node_trace,
-        edge_trace,
-        title=f"{name1.title() if name1 else '...'} x {name2.title() if name2 else '...'} Network Graph",
-    )
-    print(a1, "--4-", a2)
-    return fig
+# opt-in memory introspection, started before the data is loaded so that
+# tracemalloc sees it
+monitor = memory.MemoryMonitor() if os.getenv("MEMORY_DEBUG") == "1" else None
 
 
-def make_datatable(df: pd.DataFrame) -> dash_table.DataTable:
+def make_datatable(
+    df: pd.DataFrame, table_id: str = "datatable"
+) -> dash_table.DataTable:
     """Creates a datatable of all scholars."""
     table = dash_table.DataTable(
-        id="datatable",
+        id=table_id,
         columns=[{"name": i, "id": i} for i in df.columns],
         data=df.to_dict("records"),
         style_cell={"textAlign": "left"},
@@ -226,104 +59,232 @@ app.config["suppress_callback_exceptions"] = True
 
 
 # call these once here, in global state, at application startup, then reuse
-scholar_names = load_scholar_names_from_file()
-ipop_names = load_ipop_scholar_names_from_file()
-all_names = set(scholar_names) | set(ipop_names)
-sure_names = load_sure_scholar_names_from_file()
-
-sure_graph = create_sure_graph_figure()
-cop_network_graph = create_cop_network_graph_figure()
-ipop_network_graph = create_ipop_network_graph_figure()
+registry = datasets.Registry()
+for dataset in registry:
+    dataset.figure
 
+server.register_blueprint(api.make_blueprint(registry))
 
 counts_df = pd.read_csv("data/coauthor_counts.csv")
 table = make_datatable(counts_df)
 
-# tab for entire COP
-tab1 = dbc.Container(
-    [
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        html.H2("Description:", className="text-center text-info"),
-                        html.Hr(),
-                        html.P(
-                            [
-                                "This network graph shows authors and their direct coauthors. "
-                                "When an author is selected you are able to see the author's entire network graph. "
-                                "When you select two authors, you are able to see their combined network(s) and any "
-                                "shared connections they may have. Note that only full graphs for the selected authors "
-                                "are shown, and any other authors are only showcasing a sub-graph or sub-network of their "
-                                "entire network. To see their entire network, selected them from the dropdown. If they "
-                                "are not in the dropdown, then you can request to add them, although at this time only "
-                                "COP scholars are included. There are: ",
-                                html.Span(
-                                    f"{len(scholar_names)} COP ",
-                                    className="strong text-primary",
-                                ),
-                                "scholars/authors available to choose from.",
-                            ]
-                        ),
-                    ],
-                    width=9,
-                )
-            ],
-            justify="center",
-            align="center",
-        ),
-        dbc.Row(
+if monitor is not None:
+    server.register_blueprint(
+        memory.make_blueprint(registry, monitor, {"counts_df": counts_df})
+    )
+
+
+def make_cytoscape_box(key: str) -> list[html.Div]:
+    """Creates the hidden browser-side network view of a dataset's tab."""
+    return [
+        html.Div(
             [
-                dbc.Col(
-                    [
-                        html.Label("Author 1 Select:", className="text-info"),
-                        dcc.Dropdown(
-                            id="author-dropdown1",
-                            options=[],
-                            value="",
-                        ),
-                    ],
-                    width=4,
-                ),
-                dbc.Col(
-                    [
-                        html.Label("Author 2 Select:", className="text-info"),
-                        dcc.Dropdown(
-                            id="author-dropdown2",
-                            options=[],
-                            value="",
-                        ),
-                    ],
-                    width=4,
+                html.H5(id=f"{key}-cytoscape-title", className="text-center"),
+                cyto.Cytoscape(
+                    id=f"{key}-cytoscape",
+                    elements=[],
+                    layout={"name": "preset"},
+                    stylesheet=cytoscape.STYLESHEET,
+                    style={"width": "100%", "height": "700px"},
                 ),
             ],
-            justify="center",
-            align="center",
-        ),
-        dbc.Row(
-            [
-                dbc.Card(
-                    dbc.Spinner(
-                        dcc.Graph(id="network-graph"),
-                        type="grow",
-                        color="primary",
-                        size="lg",
+            id=f"{key}-cytoscape-box",
+            style={"display": "none"},
+        )
+    ]
+
+
+def make_network_tab(dataset: datasets.Dataset) -> dbc.Container:
+    """Creates the tab content for a dataset's network graph."""
+    key = dataset.config.key
+    count = html.Span(
+        f"{len(dataset.names)} {dataset.config.label} ",
+        className="strong text-primary",
+    )
+    if dataset.config.logo:
+        description = [
+            html.Img(
+                src=dataset.config.logo,
+                style={
+                    "display": "block",
+                    "margin-left": "auto",
+                    "margin-right": "auto",
+                    "width": "30%",
+                },
+                className="text-center",
+            ),
+            html.P(
+                [
+                    "There are: ",
+                    count,
+                    "scholars/authors available to choose from.",
+                ]
+            ),
+        ]
+    else:
+        description = [
+            html.H2("Description:", className="text-center text-info"),
+            html.Hr(),
+            html.P(
+                [
+                    "This network graph shows authors and their direct coauthors. "
+                    "When an author is selected you are able to see the author's entire network graph. "
+                    "When you select two authors, you are able to see their combined network(s) and any "
+                    "shared connections they may have. Add more authors to see a whole team's combined "
+                    "network, with coauthors shared by several of them in blue. Note that only full graphs for the selected authors "
+                    "are shown, and any other authors are only showcasing a sub-graph or sub-network of their "
+                    "entire network. To see their entire network, selected them from the dropdown. If they "
+                    "are not in the dropdown, then you can request to add them, although at this time only "
+                    "COP scholars are included. There are: ",
+                    count,
+                    "scholars/authors available to choose from.",
+                ]
+            ),
+        ]
+    return dbc.Container(
+        [
+            dbc.Row(
+                [dbc.Col(description, width=9)],
+                justify="center",
+                align="center",
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            html.Label("Author 1 Select:", className="text-info"),
+                            dcc.Dropdown(
+                                id=f"{key}-author-dropdown1",
+                                options=[],
+                                value="",
+                            ),
+                        ],
+                        width=4,
                     ),
-                    className="p-3 m-3",
-                    body=True,
-                )
-            ],
-            className="px-5",
-            justify="center",
-            align="center",
-        ),
-    ],
-    fluid=True,
-)
+                    dbc.Col(
+                        [
+                            html.Label("Author 2 Select:", className="text-info"),
+                            dcc.Dropdown(
+                                id=f"{key}-author-dropdown2",
+                                options=[],
+                                value="",
+                            ),
+                        ],
+                        width=4,
+                    ),
+                ],
+                justify="center",
+                align="center",
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            html.Label(
+                                "More Authors (whole team):", className="text-info"
+                            ),
+                            dcc.Dropdown(
+                                id=f"{key}-team-dropdown",
+                                options=[],
+                                value=[],
+                                multi=True,
+                            ),
+                        ],
+                        width=8,
+                    ),
+                ],
+                justify="center",
+                align="center",
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            html.Label("Journal Filter:", className="text-info"),
+                            dcc.Dropdown(
+                                id=f"{key}-journal-dropdown",
+                                options=dataset.journal_options(),
+                                value=[],
+                                multi=True,
+                            ),
+                        ],
+                        width=6,
+                    ),
+                    dbc.Col(
+                        [
+                            html.Label("Coauthor Hops:", className="text-info"),
+                            dcc.Slider(
+                                id=f"{key}-depth-slider",
+                                min=1,
+                                max=3,
+                                step=1,
+                                value=1,
+                                marks={hops: str(hops) for hops in range(1, 4)},
+                            ),
+                        ],
+                        width=2,
+                    ),
+                    dbc.Col(
+                        [
+                            html.Label("Show Selection As:", className="text-info"),
+                            dcc.RadioItems(
+                                id=f"{key}-view-radio",
+                                options=[
+                                    {"label": " Their network", "value": "network"},
+                                    {
+                                        "label": " Highlight on group",
+                                        "value": "highlight",
+                                    },
+                                ],
+                                value="network",
+                                labelStyle={"display": "block"},
+                            ),
+                        ],
+                        width=2,
+                    ),
+                ],
+                justify="center",
+                align="center",
+            ),
+            dcc.Store(
+                id=f"{key}-view-store",
+                data={"figure": None, "highlight": True},
+            ),
+            dbc.Row(
+                [
+                    dbc.Card(
+                        [
+                            dbc.Spinner(
+                                html.Div(
+                                    dcc.Graph(figure=dataset.figure, id=f"{key}-graph"),
+                                    id=f"{key}-graph-box",
+                                ),
+                                type="grow",
+                                color="primary",
+                                size="lg",
+                            ),
+                        ]
+                        + (make_cytoscape_box(key) if BROWSER_LAYOUT else []),
+                        className="p-3 m-3",
+                        body=True,
+                    )
+                ],
+                className="px-5",
+                justify="center",
+                align="center",
+            ),
+        ],
+        fluid=True,
+    )
 
 
-# tab for IPOP only
-tab2 = dbc.Container(
+network_tabs = {
+    f"tab-{dataset.config.key}": make_network_tab(dataset) for dataset in registry
+}
+
+
+# tabe 4 for datatabel
+tab4 = dbc.Container(
     [
         dbc.Row(
             [
@@ -333,19 +294,8 @@ tab2 = dbc.Container(
                         html.Hr(),
                         html.P(
                             [
-                                "This network graph shows authors and their direct coauthors. "
-                                "When an author is selected you are able to see the author's entire network graph. "
-                                "When you select two authors, you are able to see their combined network(s) and any "
-                                "shared connections they may have. Note that only full graphs for the selected authors "
-                                "are shown, and any other authors are only showcasing a sub-graph or sub-network of their "
-                                "entire network. To see their entire network, selected them from the dropdown. If they "
-                                "are not in the dropdown, then you can request to add them, although at this time only "
-                                "COP scholars are included. There are: ",
-                                html.Span(
-                                    f"{len(ipop_names)} IPOP ",
-                                    className="strong text-primary",
-                                ),
-                                "scholars/authors available to choose from.",
+                                "This page showcases UK COP authors and their co-authors. "
+                                "Use the dropdown to select an author and see their co-author specifically. "
                             ]
                         ),
                     ],
@@ -359,25 +309,17 @@ tab2 = dbc.Container(
             [
                 dbc.Col(
                     [
-                        html.Label("Author 1 Select:", className="text-info"),
-                        dcc.Dropdown(
-                            id="author-dropdown3",
-                            options=[],
-                            value="",
-                        ),
-                    ],
-                    width=4,
-                ),
-                dbc.Col(
-                    [
-                        html.Label("Author 2 Select:", className="text-info"),
+                        html.Label("Author Select:", className="text-info"),
                         dcc.Dropdown(
-                            id="author-dropdown4",
-                            options=[],
+                            id="table-author-dropdown",
+                            options=[
+                                {"label": person, "value": person}
+                                for person in sorted(registry["cop"].names)
+                            ],
                             value="",
                         ),
                     ],
-                    width=4,
+                    width=6,
                 ),
             ],
             justify="center",
@@ -386,13 +328,9 @@ tab2 = dbc.Container(
         dbc.Row(
             [
                 dbc.Card(
-                    dbc.Spinner(
-                        dcc.Graph(figure=ipop_network_graph, id="ipop-graph"),
-                        type="grow",
-                        color="primary",
-                        size="lg",
-                    ),
+                    children=table,
                     className="p-3 m-3",
+                    id="table-card",
                     body=True,
                 )
             ],
@@ -404,31 +342,20 @@ tab2 = dbc.Container(
     fluid=True,
 )
 
-# tab for SURE conference only
-tab3 = dbc.Container(
+# overlap tab, shared coauthor heatmap and top overlapping colleagues
+overlap_tab = dbc.Container(
     [
         dbc.Row(
             [
                 dbc.Col(
                     [
-                        html.Img(
-                            src="/assets/sure_logo.PNG",
-                            style={
-                                "display": "block",
-                                "margin-left": "auto",
-                                "margin-right": "auto",
-                                "width": "30%",
-                            },
-                            className="text-center",
-                        ),
+                        html.H2("Description:", className="text-center text-info"),
+                        html.Hr(),
                         html.P(
                             [
-                                "There are: ",
-                                html.Span(
-                                    f"{len(sure_names)} SURE ",
-                                    className="strong text-primary",
-                                ),
-                                "scholars/authors available to choose from.",
+                                "This page shows how many coauthors each pair of scholars "
+                                "in a group have in common. Select an author to list the "
+                                "scholars they overlap with the most."
                             ]
                         ),
                     ],
@@ -442,106 +369,53 @@ tab3 = dbc.Container(
             [
                 dbc.Col(
                     [
-                        html.Label("Author 1 Select:", className="text-info"),
+                        html.Label("Group Select:", className="text-info"),
                         dcc.Dropdown(
-                            id="author-dropdown5",
-                            options=[],
-                            value="",
+                            id="overlap-dataset-dropdown",
+                            options=[
+                                {"label": dataset.config.label, "value": key}
+                                for key, dataset in registry.datasets.items()
+                            ],
+                            value=datasets.DATASETS[0].key,
+                            clearable=False,
                         ),
                     ],
-                    width=4,
+                    width=3,
                 ),
                 dbc.Col(
                     [
-                        html.Label("Author 2 Select:", className="text-info"),
+                        html.Label("Author Select:", className="text-info"),
                         dcc.Dropdown(
-                            id="author-dropdown6",
-                            options=[],
-                            value="",
+                            id="overlap-author-dropdown", options=[], value=""
                         ),
                     ],
-                    width=4,
+                    width=5,
                 ),
             ],
             justify="center",
             align="center",
         ),
-        dbc.Row(
-            [
-                dbc.Card(
-                    dbc.Spinner(
-                        dcc.Graph(figure=sure_graph, id="poc-graph"),
-                        type="grow",
-                        color="primary",
-                        size="lg",
-                    ),
-                    className="p-3 m-3",
-                    body=True,
-                )
-            ],
-            className="px-5",
-            justify="center",
-            align="center",
-        ),
-    ],
-    fluid=True,
-)
-
-
-# tabe 4 for datatabel
-tab4 = dbc.Container(
-    [
         dbc.Row(
             [
                 dbc.Col(
-                    [
-                        html.H2("Description:", className="text-center text-info"),
-                        html.Hr(),
-                        html.P(
-                            [
-                                "This page showcases UK COP authors and their co-authors. "
-                                "Use the dropdown to select an author and see their co-author specifically. "
-                            ]
-                        ),
-                    ],
-                    width=9,
-                )
-            ],
-            justify="center",
-            align="center",
-        ),
-        dbc.Row(
-            [
+                    dbc.Card(
+                        dcc.Graph(id="overlap-graph"),
+                        className="p-3 m-3",
+                        body=True,
+                    ),
+                    width=8,
+                ),
                 dbc.Col(
-                    [
-                        html.Label("Author Select:", className="text-info"),
-                        dcc.Dropdown(
-                            id="author-dropdown4",
-                            options=[
-                                {"label": person, "value": person}
-                                for person in sorted(scholar_names)
-                            ],
-                            value="",
-                        ),
-                    ],
-                    width=6,
+                    dbc.Card(
+                        id="overlap-card",
+                        className="p-3 m-3",
+                        body=True,
+                    ),
+                    width=4,
                 ),
             ],
-            justify="center",
-            align="center",
-        ),
-        dbc.Row(
-            [
-                dbc.Card(
-                    children=table,
-                    className="p-3 m-3",
-                    id="table-card",
-                    body=True,
-                )
-            ],
             className="px-5",
             justify="center",
-            align="center",
         ),
     ],
     fluid=True,
@@ -553,13 +427,23 @@ main_content = dbc.Card(
         dbc.CardHeader(
             dbc.Tabs(
                 [
-                    dbc.Tab(label="COP", tab_id="tab-1", tabClassName="mx-auto"),
-                    dbc.Tab(label="IPOP", tab_id="tab-2", tabClassName="mx-auto"),
-                    dbc.Tab(label="SURE", tab_id="tab-3", tabClassName="mx-auto"),
-                    dbc.Tab(label="Data Table", tab_id="tab-4", tabClassName="mx-auto"),
+                    dbc.Tab(
+                        label=dataset.config.label,
+                        tab_id=f"tab-{dataset.config.key}",
+                        tabClassName="mx-auto",
+                    )
+                    for dataset in registry
+                ]
+                + [
+                    dbc.Tab(
+                        label="Overlap", tab_id="tab-overlap", tabClassName="mx-auto"
+                    ),
+                    dbc.Tab(
+                        label="Data Table", tab_id="tab-table", tabClassName="mx-auto"
+                    ),
                 ],
                 id="card-tabs",
-                active_tab="tab-1",
+                active_tab=f"tab-{datasets.DATASETS[0].key}",
             )
         ),
         dbc.CardBody(id="main_content_body"),
@@ -613,135 +497,222 @@ app.layout = dbc.Container(
 
 @app.callback(
     Output(component_id="table-card", component_property="children"),
-    Input(component_id="author-dropdown4", component_property="value"),
+    Input(component_id="table-author-dropdown", component_property="value"),
 )
 def update_options_table(input_value: str) -> dash_table.DataTable:
     """Dynamically adjust datatable to selected author."""
-    if input_value:
-        first, last = input_value.split(" ")
-        return make_datatable(counts_df[counts_df["Author 1"] == f"{first[0]} {last}"])
+    author = registry.resolve(input_value) if input_value else None
+    if author:
+        return make_datatable(
+            counts_df[
+                (counts_df["Author 1"] == author) | (counts_df["Author 2"] == author)
+            ]
+        )
 
     return make_datatable(df=counts_df)
 
 
 @app.callback(
-    Output(component_id="author-dropdown2", component_property="options"),
-    Input(component_id="author-dropdown1", component_property="value"),
-)
-def update_options1(input_value: str) -> list[dict[str, str]]:
-    """Dynamically adjust dropdown options to not include selected."""
-    return [
-        {"label": person, "value": person}
-        for person in sorted(scholar_names)
-        if person != input_value
-    ]
-
-
-@app.callback(
-    Output(component_id="author-dropdown1", component_property="options"),
-    Input(component_id="author-dropdown2", component_property="value"),
-)
-def update_options2(input_value: str) -> list[dict[str, str]]:
-    """Dynamically adjust dropdown options to not include selected."""
-    return [
-        {"label": person, "value": person}
-        for person in sorted(scholar_names)
-        if person != input_value
-    ]
-
-
-@app.callback(
-    Output(component_id="author-dropdown4", component_property="options"),
-    Input(component_id="author-dropdown3", component_property="value"),
+    Output("overlap-graph", "figure"),
+    Output("overlap-author-dropdown", "options"),
+    Output("overlap-author-dropdown", "value"),
+    Input("overlap-dataset-dropdown", "value"),
 )
-def update_options3(input_value: str) -> list[dict[str, str]]:
-    """Dynamically adjust dropdown options to not include selected."""
-    return [
-        {"label": person, "value": person}
-        for person in sorted(ipop_names)
-        if person != input_value
-    ]
+def update_overlap_group(key: str) -> tuple[go.Figure, list[dict[str, str]], str]:
+    """Show the selected group's heatmap and list its scholars."""
+    dataset = registry[key]
+    options = [{"label": name, "value": name} for name in sorted(dataset.names)]
+    return dataset.overlap_figure, options, ""
 
 
 @app.callback(
-    Output(component_id="author-dropdown3", component_property="options"),
-    Input(component_id="author-dropdown4", component_property="value"),
+    Output("overlap-card", "children"),
+    Input("overlap-author-dropdown", "value"),
+    State("overlap-dataset-dropdown", "value"),
 )
-def update_options4(input_value: str) -> list[dict[str, str]]:
-    """Dynamically adjust dropdown options to not include selected."""
-    return [
-        {"label": person, "value": person}
-        for person in sorted(ipop_names)
-        if person != input_value
-    ]
-
-
-@app.callback(
-    Output(component_id="author-dropdown6", component_property="options"),
-    Input(component_id="author-dropdown5", component_property="value"),
-)
-def update_options5(input_value: str) -> list[dict[str, str]]:
-    """Dynamically adjust dropdown options to not include selected."""
-    return [
-        {"label": person, "value": person}
-        for person in sorted(sure_names)
-        if person != input_value
-    ]
-
-
-@app.callback(
-    Output(component_id="author-dropdown5", component_property="options"),
-    Input(component_id="author-dropdown6", component_property="value"),
-)
-def update_options6(input_value: str) -> list[dict[str, str]]:
-    """Dynamically adjust dropdown options to not include selected."""
-    return [
-        {"label": person, "value": person}
-        for person in sorted(sure_names)
-        if person != input_value
-    ]
-
-
-@app.callback(
-    Output("network-graph", "figure"),
-    [
-        Input(component_id="author-dropdown1", component_property="value"),
-        Input(component_id="author-dropdown2", component_property="value"),
-    ],
-)
-def draw_cop_graph(author1: Union[str, None], author2: Union[str, None]) -> go.Figure:
-    """Generate new visualization given author filters or load default."""
-    if author1 or author2:
-        return pair_graph(author1, author2)
-    return cop_network_graph
+def update_overlap_table(author: Union[str, None], key: str) -> dash_table.DataTable:
+    """List the scholars sharing the most coauthors with the selected author."""
+    top = registry[key].top_overlap(author) if author else []
+    return make_datatable(
+        pd.DataFrame(top, columns=["Colleague", "Shared Coauthors"]),
+        table_id="overlap-table",
+    )
 
 
-@app.callback(
-    Output("ipop-graph", "figure"),
-    [
-        Input(component_id="author-dropdown3", component_property="value"),
-        Input(component_id="author-dropdown4", component_property="value"),
-    ],
-)
-def draw_ipop_graph(author1: Union[str, None], author2: Union[str, None]) -> go.Figure:
-    """Generate new visualization given author filters or load default."""
-    if author1 or author2:
-        return pair_graph(author1, author2)
-    return ipop_network_graph
+def register_dataset_callbacks(dataset: datasets.Dataset):
+    """Registers the dropdown and graph callbacks of a dataset's tab."""
+    key = dataset.config.key
+    names = sorted(dataset.names)
+
+    def author_options(
+        search_value: Union[str, None],
+        other_value: Union[str, None],
+        value: Union[str, None],
+    ) -> list[dict[str, str]]:
+        """Suggest coauthors matching the typed text, or the group's scholars.
+
+        The selected author of the other dropdown is left out.
+        """
+        people = registry.search(search_value) if search_value else names
+        options = [
+            {"label": person, "value": person}
+            for person in people
+            if person != other_value
+        ]
+        if value and value not in people:
+            options.insert(0, {"label": value, "value": value})
+        return options
+
+    app.callback(
+        Output(component_id=f"{key}-author-dropdown2", component_property="options"),
+        Input(
+            component_id=f"{key}-author-dropdown2", component_property="search_value"
+        ),
+        Input(component_id=f"{key}-author-dropdown1", component_property="value"),
+        State(component_id=f"{key}-author-dropdown2", component_property="value"),
+    )(author_options)
+    app.callback(
+        Output(component_id=f"{key}-author-dropdown1", component_property="options"),
+        Input(
+            component_id=f"{key}-author-dropdown1", component_property="search_value"
+        ),
+        Input(component_id=f"{key}-author-dropdown2", component_property="value"),
+        State(component_id=f"{key}-author-dropdown1", component_property="value"),
+    )(author_options)
+
+    @app.callback(
+        Output(component_id=f"{key}-journal-dropdown", component_property="options"),
+        Input(
+            component_id=f"{key}-journal-dropdown", component_property="search_value"
+        ),
+        State(component_id=f"{key}-journal-dropdown", component_property="value"),
+        prevent_initial_call=True,
+    )
+    def journal_options(
+        search_value: Union[str, None], values: Union[list[str], None]
+    ) -> list[dict[str, str]]:
+        """Suggest the group's journals matching the typed text.
+
+        Selected journals are always listed so they stay selected.
+        """
+        options = dataset.journal_options(search_value)
+        listed = {option["value"] for option in options}
+        return [
+            dataset.journal_option(value)
+            for value in values or []
+            if value not in listed
+        ] + options
+
+    @app.callback(
+        Output(component_id=f"{key}-team-dropdown", component_property="options"),
+        Input(component_id=f"{key}-team-dropdown", component_property="search_value"),
+        State(component_id=f"{key}-team-dropdown", component_property="value"),
+    )
+    def team_options(
+        search_value: Union[str, None], values: Union[list[str], None]
+    ) -> list[dict[str, str]]:
+        """Suggest coauthors matching the typed text, or the group's scholars.
+
+        Selected authors are always listed so they stay selected.
+        """
+        people = registry.search(search_value) if search_value else names
+        selected = [value for value in values or [] if value not in people]
+        return [{"label": person, "value": person} for person in selected + people]
+
+    @app.callback(
+        Output(f"{key}-view-store", "data"),
+        [
+            Input(component_id=f"{key}-author-dropdown1", component_property="value"),
+            Input(component_id=f"{key}-author-dropdown2", component_property="value"),
+            Input(component_id=f"{key}-team-dropdown", component_property="value"),
+            Input(component_id=f"{key}-journal-dropdown", component_property="value"),
+            Input(component_id=f"{key}-depth-slider", component_property="value"),
+            Input(component_id=f"{key}-view-radio", component_property="value"),
+        ],
+        prevent_initial_call=True,
+    )
+    def draw_graph(
+        author1: Union[str, None],
+        author2: Union[str, None],
+        team: Union[list[str], None],
+        journal_titles: Union[list[str], None],
+        depth: Union[int, None],
+        view: Union[str, None],
+    ) -> dict:
+        """Generate new visualization given author and journal filters or load default.
+
+        A figure is only sent when its node set changes. Highlighting authors
+        on an unchanged group or journal figure is done in the browser
+        (assets/highlight.js). With BROWSER_LAYOUT, pair
+        networks are sent as elements and laid out in the browser instead
+        (assets/cytoscape.js). Adding more authors draws the union of every
+        selected author's network.
+        """
+        if team and view != "highlight":
+            selected = [author1, author2, *team]
+            if BROWSER_LAYOUT:
+                return {
+                    "figure": None,
+                    "highlight": False,
+                    **dataset.team_elements(selected, journal_titles, depth or 1),
+                }
+            return {
+                "figure": dataset.team_figure(selected, journal_titles, depth or 1),
+                "highlight": False,
+            }
+        if (author1 or author2) and view != "highlight" and BROWSER_LAYOUT:
+            return {
+                "figure": None,
+                "highlight": False,
+                **dataset.pair_elements(author1, author2, journal_titles, depth or 1),
+            }
+        if (author1 or author2) and view != "highlight":
+            return {
+                "figure": dataset.pair_figure(
+                    author1, author2, journal_titles, depth or 1
+                ),
+                "highlight": False,
+            }
+        changed = {t["prop_id"].split(".")[0] for t in dash.callback_context.triggered}
+        if changed == {f"{key}-view-radio"} and not (author1 or author2 or team):
+            raise PreventUpdate
+        if view == "highlight" and changed <= {
+            f"{key}-author-dropdown1",
+            f"{key}-author-dropdown2",
+            f"{key}-team-dropdown",
+            f"{key}-depth-slider",
+        }:
+            raise PreventUpdate
+        if journal_titles:
+            figure = dataset.journal_figure(journal_titles)
+            return {"figure": figure, "highlight": True}
+        return {"figure": dataset.figure, "highlight": True}
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="network", function_name="highlight"),
+        Output(f"{key}-graph", "figure"),
+        Input(f"{key}-view-store", "data"),
+        Input(f"{key}-author-dropdown1", "value"),
+        Input(f"{key}-author-dropdown2", "value"),
+        Input(f"{key}-team-dropdown", "value"),
+        State(f"{key}-graph", "figure"),
+        prevent_initial_call=True,
+    )
+    if BROWSER_LAYOUT:
+        app.clientside_callback(
+            ClientsideFunction(namespace="cytoscape", function_name="render"),
+            Output(f"{key}-graph-box", "style"),
+            Output(f"{key}-cytoscape-box", "style"),
+            Output(f"{key}-cytoscape", "elements"),
+            Output(f"{key}-cytoscape", "layout"),
+            Output(f"{key}-cytoscape-title", "children"),
+            Input(f"{key}-view-store", "data"),
+            prevent_initial_call=True,
+        )
 
 
-@app.callback(
-    Output("poc-graph", "figure"),
-    [
-        Input(component_id="author-dropdown5", component_property="value"),
-        Input(component_id="author-dropdown6", component_property="value"),
-    ],
-)
-def draw_poc_graph(author1: Union[str, None], author2: Union[str, None]) -> go.Figure:
-    """Generate new visualization given author filters or load default."""
-    if author1 or author2:
-        return pair_graph_sure(author1, author2)
-    return sure_graph
+for dataset in registry:
+    register_dataset_callbacks(dataset)
 
 
 @app.callback(
@@ -749,14 +720,11 @@ def draw_poc_graph(author1: Union[str, None], author2: Union[str, None]) -> go.F
 )
 def tab_content(active_tab):
     """Control tab navigation."""
-    if active_tab == "tab-2":
-        return tab2
-    elif active_tab == "tab-3":
-        return tab3
-    elif active_tab == "tab-4":
+    if active_tab == "tab-table":
         return tab4
-    else:
-        return tab1
+    if active_tab == "tab-overlap":
+        return overlap_tab
+    return network_tabs.get(active_tab, next(iter(network_tabs.values())))
 
 
 # run main application
@@ -0,0 +1,114 @@
+"""Profiles the app's memory, in-process or through a running server.
+
+In-process (default), the app is imported with tracemalloc running, the deep
+size of every loaded object is printed, then simulated sessions are replayed
+through the callback endpoint in rounds; each round prints the RSS and the
+allocation sites that grew since the previous round, so memory that keeps
+growing from round to round points at a leak in the per-request code.
+
+With `--url`, the `/debug/memory` report of a server started with
+`MEMORY_DEBUG=1` is fetched and printed instead.
+
+Usage:
+    python memprofile.py [--rounds 5] [--requests 50]
+    python memprofile.py --url http://127.0.0.1:8050 [--deep] [--diff]
+"""
+
+import argparse
+import json
+import os
+import urllib.request
+
+
+def mb(size: int) -> str:
+    """Formats a byte count in megabytes."""
+    return f"{size / 2**20:,.1f} MB"
+
+
+def print_sizes(sizes: dict[str, int]):
+    """Prints deep sizes, largest first."""
+    print(f"\n{'object':<28} {'deep size':>12}")
+    for name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        print(f"{name:<28} {mb(size):>12}")
+    print(f"{'total':<28} {mb(sum(sizes.values())):>12}")
+
+
+def print_diff(diff: dict, limit: int):
+    """Prints the allocation sites that grew the most."""
+    print(f"traced {mb(diff['traced'])}, peak {mb(diff['traced_peak'])}")
+    for row in diff["top"][:limit]:
+        grown = row["size_diff"] if row["size_diff"] is not None else row["size"]
+        print(
+            f"  {grown / 1024:>+10,.1f} KiB  {row['count']:>8} blocks  {row['where']}"
+        )
+
+
+def profile_remote(url: str, deep: bool, diff: bool, limit: int):
+    """Prints the memory report of a running server."""
+    query = "?deep=1" if deep else ""
+    with urllib.request.urlopen(f"{url}/debug/memory{query}") as response:
+        report = json.load(response)
+    print(
+        f"pid {report['pid']}: rss {mb(report['rss'])}, peak {mb(report['peak_rss'])}"
+    )
+    if report["history"]:
+        first, last = report["history"][0], report["history"][-1]
+        print(
+            f"rss {mb(first['rss'])} -> {mb(last['rss'])} over "
+            f"{last['time'] - first['time']:.0f}s"
+        )
+    grown = sorted(report["requests"], key=lambda row: -row["delta"])[:limit]
+    if grown:
+        print("\nrequests that grew rss the most:")
+        for row in grown:
+            print(f"  {row['delta'] / 1024:>+10,.1f} KiB  {row['path']}")
+    print("\nloaded caches:", json.dumps(report["caches"], indent=2))
+    if deep:
+        print_sizes({row["name"]: row["size"] for row in report["deep_sizes"]})
+    if diff:
+        with urllib.request.urlopen(f"{url}/debug/memory/diff") as response:
+            print()
+            print_diff(json.load(response), limit)
+
+
+def profile_local(rounds: int, requests: int, limit: int, seed: int):
+    """Loads the app in-process and replays sessions in rounds."""
+    os.environ["MEMORY_DEBUG"] = "1"
+    import loadtest
+    import main
+    from utils import memory
+
+    print(f"rss after loading the app: {mb(memory.rss())}")
+    print_sizes(memory.registry_sizes(main.registry, {"counts_df": main.counts_df}))
+
+    client = main.server.test_client()
+    factory = loadtest.SessionFactory(seed)
+    main.monitor.diff()
+    for i in range(1, rounds + 1):
+        sent = 0
+        while sent < requests:
+            for _, body in factory.session():
+                client.post(loadtest.CALLBACK_URL, json=body)
+                sent += 1
+        print(f"\nround {i}: {sent} requests, rss {mb(memory.rss())}")
+        print_diff(main.monitor.diff(), limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--url", help="report on a server started with MEMORY_DEBUG=1")
+    parser.add_argument("--deep", action="store_true", help="include deep sizes")
+    parser.add_argument("--diff", action="store_true", help="include a snapshot diff")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=50, help="requests per round")
+    parser.add_argument("--top", type=int, default=10, help="rows per listing")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.url:
+        profile_remote(args.url.rstrip("/"), args.deep, args.diff, args.top)
+    else:
+        profile_local(args.rounds, args.requests, args.top, args.seed)
+
+
+if __name__ == "__main__":
+    main()
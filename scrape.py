@@ -1,47 +1,149 @@
-import scholar_network
+"""Scrapes the COP and IPOP scholars' publications from Google Scholar.
+
+Before scraping a scholar, the first page of their profile (newest
+publications first) is fingerprinted and compared with the scrape cache;
+unchanged scholars are skipped and their cached publications reused. Once
+every scholar is cached, all publications are written to `data/scraped.json`.
+
+Usage:
+    python scrape.py [--force] [--max-age-days 90]
+"""
+
+import argparse
 import csv
 import time
+from typing import Union
+
+from scholar_network.scraping import get_publication_data
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from tqdm import tqdm
 
+from utils import scrape_cache
+
+SCHOLAR_FILES = ["data/IPOP-Scholars.csv", "data/COPscholars.csv"]
+OUTPUT_FILE = "data/scraped.json"
+# seconds to wait between requests to Google Scholar
+DELAY = 5
+# failures worth a retry: the browser or the connection to Google Scholar, not
+# errors in this script
+SCRAPE_ERRORS = (WebDriverException, OSError)
+
 
 def load_scholar_names() -> tuple[list[str], list[str]]:
     authors = list()
     ids = list()
-    with open("data/IPOP-Scholars.csv", "r", encoding="utf-8-sig") as f:
-        csvreader = csv.DictReader(f)
-        for row in csvreader:
-            authors.append(row.get("Name"))
-            ids.append(row.get("ID"))
-    with open("data/COPScholars.csv", "r", encoding="utf-8-sig") as f:
-        csvreader = csv.DictReader(f)
-        for row in csvreader:
-            authors.append(row.get("Name"))
-            ids.append(row.get("ID"))
+    for fpath in SCHOLAR_FILES:
+        with open(fpath, "r", encoding="utf-8-sig") as f:
+            csvreader = csv.DictReader(f)
+            for row in csvreader:
+                authors.append(row.get("Name"))
+                ids.append(row.get("ID"))
     return authors, ids
 
 
-authors, ids = load_scholar_names()
-info = [{"name": x, "id": y} for x, y in zip(authors, ids)]
+def profile_fingerprint(scholar_id: str) -> dict:
+    """Reads the first page of a scholar's profile, newest publications first.
 
+    This is one page load, against one per publication for a full scrape.
 
-failed = list()
+    Args:
+        scholar_id (str): Google Scholar ID.
 
-for person in tqdm(info):
+    Returns:
+        dict: titles listed on the first page and whether there are more pages.
+    """
+    driver = webdriver.Safari()
     try:
-        scholar_network.scrape_single_author(
-            person.get("id", ""), person.get("name", "")
+        driver.get(
+            f"https://scholar.google.com/citations?&hl=en&user={scholar_id}"
+            "&cstart=0&pagesize=100&view_op=list_works&sortby=pubdate"
         )
-    except Exception:
-        print(f"{person.get('name')} failed")
-        failed.append(person)
-    time.sleep(5)
+        titles = [
+            pub.text for pub in driver.find_elements_by_css_selector("a.gsc_a_at")
+        ]
+        more = driver.find_element_by_id("gsc_bpf_more").is_enabled()
+    finally:
+        driver.close()
+    return {"titles": titles, "more": more}
 
 
-for person in tqdm(failed):
-    try:
-        scholar_network.scrape_single_author(
-            person.get("id", ""), person.get("name", "")
+def scrape(
+    cache: scrape_cache.ScrapeCache,
+    scholar_id: str,
+    name: str,
+    force: bool = False,
+    max_age: Union[float, None] = None,
+) -> bool:
+    """Scrapes one scholar unless their profile is unchanged since the last run.
+
+    Args:
+        cache (scrape_cache.ScrapeCache): scrape cache.
+        scholar_id (str): Google Scholar ID.
+        name (str): scholar name.
+        force (bool, optional): scrape even if unchanged. Defaults to False.
+        max_age (Union[float, None], optional): seconds after which a scholar is scraped
+            even if unchanged. Defaults to None.
+
+    Returns:
+        bool: True if the scholar was scraped, False if the cache was reused.
+    """
+    fingerprint = profile_fingerprint(scholar_id)
+    if not force and cache.is_fresh(scholar_id, fingerprint, max_age):
+        return False
+    time.sleep(DELAY)
+    records = get_publication_data(scholar_id, name)
+    cache.put(scholar_id, name, fingerprint, records)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--force", action="store_true", help="scrape every scholar")
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=90,
+        help="re-scrape scholars cached longer ago than this, even if unchanged",
+    )
+    args = parser.parse_args()
+
+    cache = scrape_cache.ScrapeCache()
+    authors, ids = load_scholar_names()
+    info = [{"name": x, "id": y} for x, y in zip(authors, ids)]
+    max_age = args.max_age_days * 24 * 60 * 60
+
+    failed = list()
+    scraped = 0
+    for person in tqdm(info):
+        try:
+            scraped += scrape(
+                cache, person.get("id", ""), person.get("name", ""), args.force, max_age
+            )
+        except SCRAPE_ERRORS:
+            print(f"{person.get('name')} failed")
+            failed.append(person)
+        time.sleep(DELAY)
+
+    for person in tqdm(failed):
+        try:
+            scraped += scrape(
+                cache, person.get("id", ""), person.get("name", ""), args.force, max_age
+            )
+        except SCRAPE_ERRORS as e:
+            print(e)
+            print(f"{person.get('name')} failed AGAIN!!")
+
+    print(f"{scraped} scraped, {len(info) - scraped} unchanged or failed")
+    missing = cache.merge(ids, OUTPUT_FILE)
+    if missing:
+        print(
+            f"{OUTPUT_FILE} not updated, {len(missing)} scholars were never "
+            f"scraped: {', '.join(missing)}"
         )
-    except Exception as e:
-        print(e)
-        print(f"{person.get('name')} failed AGAIN!!")
\ No newline at end of file
+    else:
+        print(f"Wrote {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
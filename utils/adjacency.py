@@ -0,0 +1,258 @@
+"""Adjacency index of the base graph.
+
+The base graph is flattened once into CSR arrays (`indptr`, `indices`,
+`weights`, `edge_ids`) so neighborhoods are expanded with numpy slices instead
+of walking networkx dicts. The build saves the arrays, so the app never loads
+the full networkx graph.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Union
+
+import networkx as nx
+import numpy as np
+
+MAX_NODES = 750
+MAX_EDGES = 7500
+
+
+@dataclass
+class Neighborhood:
+    """Result of a bounded neighborhood expansion.
+
+    Attributes:
+        nodes (list[str]): node names kept, seeds first.
+        edges (list[tuple[str, str]]): edges kept between those nodes.
+        weights (list[int]): weight of each kept edge.
+        trimmed_nodes (int): neighbors dropped to stay within the node budget.
+        trimmed_edges (int): edges dropped to stay within the edge budget.
+        shared (list[str]): kept direct neighbors of more than one seed.
+    """
+
+    nodes: list[str]
+    edges: list[tuple[str, str]]
+    weights: list[int] = field(default_factory=list)
+    trimmed_nodes: int = 0
+    trimmed_edges: int = 0
+    shared: list[str] = field(default_factory=list)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether a budget cut the neighborhood short."""
+        return bool(self.trimmed_nodes or self.trimmed_edges)
+
+    def graph(self) -> nx.Graph:
+        """Builds the weighted graph of the kept nodes and edges."""
+        graph = nx.Graph()
+        graph.add_nodes_from(self.nodes)
+        graph.add_weighted_edges_from(
+            (u, v, w) for (u, v), w in zip(self.edges, self.weights)
+        )
+        return graph
+
+
+class AdjacencyIndex:
+    """CSR adjacency arrays of a weighted graph."""
+
+    def __init__(
+        self,
+        names: list[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        edge_ids: np.ndarray,
+    ):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.edge_ids = edge_ids
+        self.degree = np.diff(indptr)
+
+    @classmethod
+    def from_graph(cls, graph: nx.Graph) -> "AdjacencyIndex":
+        """Flattens a graph whose edges carry `id` and `weight` attributes.
+
+        Args:
+            graph (nx.Graph): base graph.
+
+        Returns:
+            AdjacencyIndex: the index.
+        """
+        names = list(graph.nodes())
+        index = {name: i for i, name in enumerate(names)}
+        n_entries = 2 * graph.number_of_edges()
+        indptr = np.zeros(len(names) + 1, dtype=np.int64)
+        indices = np.empty(n_entries, dtype=np.int32)
+        weights = np.empty(n_entries, dtype=np.int32)
+        edge_ids = np.empty(n_entries, dtype=np.int32)
+        pos = 0
+        for i, (_, nbrs) in enumerate(graph.adjacency()):
+            for nbr, data in nbrs.items():
+                indices[pos] = index[nbr]
+                weights[pos] = data.get("weight", 1)
+                edge_ids[pos] = data.get("id", -1)
+                pos += 1
+            indptr[i + 1] = pos
+        return cls(names, indptr, indices, weights, edge_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges, each is listed from both of its nodes."""
+        return len(self.indices) // 2
+
+    def save(self, fpath: str):
+        """Saves the node names and the CSR arrays.
+
+        Args:
+            fpath (str): destination .npz file.
+        """
+        np.savez_compressed(
+            fpath,
+            names=np.array(self.names),
+            indptr=self.indptr,
+            indices=self.indices,
+            weights=self.weights,
+            edge_ids=self.edge_ids,
+        )
+
+    @classmethod
+    def load(cls, fpath: str) -> "AdjacencyIndex":
+        """Loads an index saved by `AdjacencyIndex.save`.
+
+        Args:
+            fpath (str): source .npz file.
+
+        Returns:
+            AdjacencyIndex: the loaded index.
+        """
+        with np.load(fpath) as data:
+            return cls(
+                data["names"].tolist(),
+                data["indptr"],
+                data["indices"],
+                data["weights"],
+                data["edge_ids"],
+            )
+
+    def _entries(self, nodes: np.ndarray) -> np.ndarray:
+        """Positions in the CSR arrays of every neighbor entry of the nodes."""
+        if not len(nodes):
+            return np.array([], dtype=np.int64)
+        starts = self.indptr[nodes]
+        lengths = self.indptr[nodes + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return np.arange(lengths.sum()) + offsets
+
+    def neighbors(
+        self, name: str, allowed_edges: Union[np.ndarray, None] = None
+    ) -> list[tuple[str, int]]:
+        """Lists a node's neighbors, heaviest edges first.
+
+        Args:
+            name (str): node name.
+            allowed_edges (Union[np.ndarray, None], optional): boolean mask over
+                edge ids, edges outside it are ignored. Defaults to None.
+
+        Returns:
+            list[tuple[str, int]]: neighbor and edge weight, ties by name.
+        """
+        if name not in self.index:
+            return []
+        entries = self._entries(np.array([self.index[name]]))
+        if allowed_edges is not None:
+            entries = entries[allowed_edges[self.edge_ids[entries]]]
+        found = [
+            (self.names[i], w)
+            for i, w in zip(
+                self.indices[entries].tolist(), self.weights[entries].tolist()
+            )
+        ]
+        return sorted(found, key=lambda item: (-item[1], item[0]))
+
+    def neighborhood(
+        self,
+        seeds: Iterable[str],
+        depth: int = 1,
+        max_nodes: int = MAX_NODES,
+        max_edges: int = MAX_EDGES,
+        allowed_edges: Union[np.ndarray, None] = None,
+    ) -> Neighborhood:
+        """Expands the seeds breadth-first within a node and edge budget.
+
+        At each hop, unvisited neighbors are ranked by the total weight of
+        their edges to the frontier, then by degree, and only as many as fit
+        in the node budget are kept, so direct neighbors shared by several
+        seeds rank first. If the edges among the kept nodes exceed
+        the edge budget, the edges that reached each node are kept first,
+        then the heaviest of the rest.
+
+        Args:
+            seeds (Iterable[str]): node names to start from.
+            depth (int, optional): number of hops. Defaults to 1.
+            max_nodes (int, optional): node budget. Defaults to MAX_NODES.
+            max_edges (int, optional): edge budget. Defaults to MAX_EDGES.
+            allowed_edges (Union[np.ndarray, None], optional): boolean mask over
+                edge ids, edges outside it are ignored. Defaults to None.
+
+        Returns:
+            Neighborhood: kept nodes and edges, with what was trimmed.
+        """
+        seed_ids = [self.index[s] for s in dict.fromkeys(seeds) if s in self.index]
+        visited = np.zeros(len(self.names), dtype=bool)
+        visited[seed_ids] = True
+        kept = list(seed_ids)
+        tree_edges = [np.array([], dtype=np.int32)]
+        frontier = np.array(seed_ids, dtype=np.int64)
+        trimmed_nodes = 0
+        shared = np.array([], dtype=np.int64)
+        for hop in range(depth):
+            entries = self._entries(frontier)
+            if allowed_edges is not None:
+                entries = entries[allowed_edges[self.edge_ids[entries]]]
+            entries = entries[~visited[self.indices[entries]]]
+            if not len(entries):
+                break
+            candidates, inverse = np.unique(self.indices[entries], return_inverse=True)
+            scores = np.bincount(inverse, weights=self.weights[entries])
+            order = np.lexsort((-self.degree[candidates], -scores))
+            budget = max(max_nodes - len(kept), 0)
+            trimmed_nodes += max(len(candidates) - budget, 0)
+            chosen = candidates[order[:budget]]
+            if hop == 0 and len(seed_ids) > 1:
+                # each entry is a distinct seed-neighbor edge
+                seed_links = np.bincount(inverse)[order[:budget]]
+                shared = chosen[seed_links > 1]
+            visited[chosen] = True
+            reached = np.zeros(len(self.names), dtype=bool)
+            reached[chosen] = True
+            tree_edges.append(self.edge_ids[entries[reached[self.indices[entries]]]])
+            kept.extend(chosen.tolist())
+            frontier = chosen
+            if not len(chosen):
+                break
+
+        entries = self._entries(np.array(kept, dtype=np.int64))
+        sources = np.repeat(np.array(kept), self.degree[kept])
+        targets = self.indices[entries]
+        mask = visited[targets] & (sources < targets)
+        if allowed_edges is not None:
+            mask &= allowed_edges[self.edge_ids[entries]]
+        entries, sources, targets = entries[mask], sources[mask], targets[mask]
+        trimmed_edges = max(len(entries) - max_edges, 0)
+        if trimmed_edges:
+            is_tree = np.isin(self.edge_ids[entries], np.concatenate(tree_edges))
+            order = np.lexsort((-self.weights[entries], ~is_tree))[:max_edges]
+            entries, sources, targets = entries[order], sources[order], targets[order]
+        return Neighborhood(
+            nodes=[self.names[i] for i in kept],
+            edges=[
+                (self.names[u], self.names[v])
+                for u, v in zip(sources.tolist(), targets.tolist())
+            ],
+            weights=self.weights[entries].tolist(),
+            trimmed_nodes=trimmed_nodes,
+            trimmed_edges=trimmed_edges,
+            shared=[self.names[i] for i in shared.tolist()],
+        )
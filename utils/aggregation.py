@@ -0,0 +1,162 @@
+"""Edge aggregation.
+
+Publications are resolved to canonical author names and deduplicated (the
+same paper is scraped once from each coauthor's profile), then streamed once:
+every co-author pair increments the weight of its edge, and the same pass
+records the journal postings. The coauthor counts table is read straight off
+the weighted edges.
+"""
+
+import csv
+import hashlib
+import itertools
+import json
+from typing import Iterable
+
+import networkx as nx
+
+from utils import journals, utils
+
+COAUTHOR_COUNTS_FILE = "data/coauthor_counts.csv"
+
+
+def load_publications(fpath: str) -> list[dict[str, str]]:
+    """Loads scraped publication data.
+
+    Args:
+        fpath (str): scraped json file.
+
+    Returns:
+        list[dict[str, str]]: List of publication data.
+    """
+    with open(fpath, "r", encoding="utf-8-sig") as f:
+        return json.load(f)
+
+
+def resolve_authors(
+    publications: Iterable[dict[str, str]],
+) -> list[tuple[tuple[str, ...], str]]:
+    """Resolves each publication's author list to canonical node names.
+
+    Names are reduced to their first and last parts, and names differing only
+    in case are merged into their first-seen spelling.
+
+    Args:
+        publications (Iterable[dict[str, str]]): publication records.
+
+    Returns:
+        list[tuple[tuple[str, ...], str]]: sorted, unique authors and journal
+        title of every publication.
+    """
+    canonical: dict[str, str] = {}
+    records = []
+    for pub in publications:
+        co_authors = set()
+        for c in pub.get("authors", "").split(","):
+            if c.strip():
+                name = utils.parse_name(c)
+                co_authors.add(canonical.setdefault(name.casefold(), name))
+        records.append((tuple(sorted(co_authors)), pub.get("journal_title", "")))
+    return records
+
+
+def publication_key(authors: Iterable[str], journal_title: str) -> str:
+    """Identifies a publication by its normalized authors and journal.
+
+    Args:
+        authors (Iterable[str]): canonical author names.
+        journal_title (str): journal title as scraped.
+
+    Returns:
+        str: hex sha1 of the casefolded, sorted authors and the journal key.
+    """
+    payload = "\x1f".join(sorted(author.casefold() for author in authors))
+    payload += "\x1e" + journals.journal_key(journal_title)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def dedupe_records(
+    records: Iterable[tuple[tuple[str, ...], str]],
+    sources: Iterable[tuple[str, int]],
+) -> tuple[list[tuple[tuple[str, ...], str]], dict[str, list[tuple[str, int]]]]:
+    """Keeps one record per publication, remembering where each was scraped.
+
+    Args:
+        records (Iterable[tuple[tuple[str, ...], str]]): resolved authors and
+            journal title of every scraped record, see `resolve_authors`.
+        sources (Iterable[tuple[str, int]]): file and position of each record.
+
+    Returns:
+        tuple[list[tuple[tuple[str, ...], str]], dict[str, list[tuple[str, int]]]]:
+        first-seen record of every publication, and the sources of each
+        publication keyed by `publication_key`, in the same order.
+    """
+    unique = []
+    provenance: dict[str, list[tuple[str, int]]] = {}
+    for record, source in zip(records, sources):
+        key = publication_key(*record)
+        if key not in provenance:
+            provenance[key] = []
+            unique.append(record)
+        provenance[key].append(source)
+    return unique, provenance
+
+
+def aggregate_edges(
+    records: Iterable[tuple[tuple[str, ...], str]],
+) -> tuple[nx.Graph, journals.JournalIndexBuilder]:
+    """Builds the weighted co-authorship graph in a single pass.
+
+    Each edge gets an `id` in first-seen order and a `weight` equal to the
+    number of publications shared by the two authors.
+
+    Args:
+        records (Iterable[tuple[tuple[str, ...], str]]): resolved authors and
+            journal title of every publication, see `dedupe_records`.
+
+    Returns:
+        tuple[nx.Graph, journals.JournalIndexBuilder]: weighted graph and
+        journal postings of its edges.
+    """
+    graph = nx.Graph()
+    journal_index = journals.JournalIndexBuilder()
+    n_edges = 0
+    for co_authors, journal_title in records:
+        edge_ids = []
+        for u, v in itertools.combinations(co_authors, 2):
+            data = graph.get_edge_data(u, v)
+            if data is None:
+                graph.add_edge(u, v, id=n_edges, weight=1)
+                edge_ids.append(n_edges)
+                n_edges += 1
+            else:
+                data["weight"] += 1
+                edge_ids.append(data["id"])
+        journal_index.add(journal_title, edge_ids)
+    return graph, journal_index
+
+
+def write_coauthor_counts(
+    graph: nx.Graph, members: set[str], fpath: str = COAUTHOR_COUNTS_FILE
+):
+    """Writes the coauthor counts table from the weighted edges.
+
+    Only edges touching at least one member are written, most frequent first.
+
+    Args:
+        graph (nx.Graph): weighted co-authorship graph.
+        members (set[str]): node names of the scholars to report on.
+        fpath (str, optional): Destination file. Defaults to COAUTHOR_COUNTS_FILE.
+    """
+    rows = sorted(
+        (
+            (-weight, *sorted((u, v)))
+            for u, v, weight in graph.edges(data="weight", default=1)
+            if u in members or v in members
+        )
+    )
+    with open(fpath, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Author 1", "Author 2", "CoAuthor Counts"])
+        for weight, author1, author2 in rows:
+            writer.writerow([author1, author2, -weight])
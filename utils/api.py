@@ -0,0 +1,219 @@
+"""JSON query API over the registry already loaded by the app.
+
+Mounted on the Dash app's Flask server under `/api`:
+
+    GET /api/datasets
+    GET /api/<dataset>/metrics
+    GET /api/<dataset>/neighbors?author=...&limit=&offset=
+    GET /api/<dataset>/subgraph?author=...[&author=...]&depth=&journal=...&limit=&offset=
+    GET /api/<dataset>/path?source=...&target=...
+
+Graph queries only follow the group's edges. Node lists take `limit` and
+`offset`; a subgraph page holds the edges whose first endpoint (in node
+order) is on that page, so concatenating pages yields every edge once.
+Subgraphs are streamed as NDJSON (one node or edge per line) with
+`format=ndjson` or `Accept: application/x-ndjson`. Responses are cacheable:
+their ETag is derived from the base graph digest and the request, so they
+only change when the data is rebuilt.
+"""
+
+import hashlib
+import json
+from typing import Iterator, Union
+
+import networkx as nx
+from flask import Blueprint, Response, abort, jsonify, request
+from werkzeug.exceptions import HTTPException
+
+from utils import datasets
+
+DEFAULT_LIMIT = 1000
+MAX_LIMIT = 10000
+MAX_DEPTH = 3
+CACHE_MAX_AGE = 3600
+NDJSON = "application/x-ndjson"
+
+
+def page_args() -> tuple[int, int]:
+    """Reads `limit` and `offset` from the query string.
+
+    Returns:
+        tuple[int, int]: limit, clamped to MAX_LIMIT, and offset.
+    """
+    limit = request.args.get("limit", DEFAULT_LIMIT, type=int)
+    offset = request.args.get("offset", 0, type=int)
+    if limit < 0 or offset < 0:
+        abort(400, "limit and offset must not be negative")
+    return min(limit, MAX_LIMIT), offset
+
+
+def wants_ndjson() -> bool:
+    """Whether the client asked for NDJSON rather than a json document."""
+    if "format" in request.args:
+        return request.args["format"] == "ndjson"
+    return request.accept_mimetypes.best_match(["application/json", NDJSON]) == NDJSON
+
+
+def make_blueprint(registry: datasets.Registry) -> Blueprint:
+    """Creates the API blueprint.
+
+    Args:
+        registry (datasets.Registry): registry served by the app.
+
+    Returns:
+        Blueprint: blueprint to register on the Flask server.
+    """
+    api = Blueprint("api", __name__, url_prefix="/api")
+
+    def dataset(key: str) -> datasets.Dataset:
+        if key not in registry.datasets:
+            abort(404, f"unknown dataset {key!r}")
+        return registry[key]
+
+    def resolve(name: Union[str, None], param: str) -> str:
+        name = (name or "").strip()
+        if not name:
+            abort(400, f"missing {param}")
+        node = registry.resolve(name)
+        if node is None:
+            abort(404, f"unknown author {name!r}")
+        return node
+
+    def etag() -> str:
+        payload = f"{registry.digest}:{request.full_path}:{wants_ndjson()}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @api.before_request
+    def not_modified():
+        """Answers 304 before doing any work if the client's copy is current."""
+        if etag() in request.if_none_match:
+            response = Response(status=304)
+            response.set_etag(etag())
+            return response
+        return None
+
+    @api.after_request
+    def cache_headers(response: Response) -> Response:
+        if response.status_code in (200, 304):
+            response.set_etag(etag())
+            response.headers["Cache-Control"] = f"public, max-age={CACHE_MAX_AGE}"
+        return response
+
+    @api.errorhandler(HTTPException)
+    def json_error(error: HTTPException):
+        return jsonify(error=error.description), error.code
+
+    @api.get("/datasets")
+    def list_datasets():
+        """Lists the configured groups."""
+        return jsonify(
+            [
+                {
+                    "key": key,
+                    "label": group.config.label,
+                    "scholars": len(group.names),
+                    "members": len(group.members),
+                }
+                for key, group in registry.datasets.items()
+            ]
+        )
+
+    @api.get("/<key>/metrics")
+    def group_metrics(key: str):
+        """Network metrics of a group, as produced by the build."""
+        return jsonify(dataset(key).metrics)
+
+    @api.get("/<key>/neighbors")
+    def neighbors(key: str):
+        """Coauthors of an author within the group, heaviest edges first."""
+        group = dataset(key)
+        author = resolve(request.args.get("author"), "author")
+        limit, offset = page_args()
+        found = registry.adjacency.neighbors(author, group.edge_mask)
+        return jsonify(
+            author=author,
+            total=len(found),
+            limit=limit,
+            offset=offset,
+            neighbors=[
+                {"name": name, "weight": weight, "member": name in group.members}
+                for name, weight in found[offset : offset + limit]
+            ],
+        )
+
+    @api.get("/<key>/subgraph")
+    def subgraph(key: str):
+        """Budgeted ego (one author) or pair (two authors) network."""
+        group = dataset(key)
+        authors = [resolve(name, "author") for name in request.args.getlist("author")]
+        if not authors:
+            abort(400, "missing author")
+        depth = request.args.get("depth", 1, type=int)
+        if not 1 <= depth <= MAX_DEPTH:
+            abort(400, f"depth must be between 1 and {MAX_DEPTH}")
+        limit, offset = page_args()
+        graph, hood = registry.neighborhood(
+            authors,
+            depth,
+            request.args.getlist("journal") or None,
+            within=group.edge_mask,
+        )
+        page = hood.nodes[offset : offset + limit]
+        order = {node: i for i, node in enumerate(hood.nodes)}
+        on_page = set(page)
+        edges = [(u, v) if order[u] < order[v] else (v, u) for u, v in hood.edges]
+        edges = [(u, v) for u, v in edges if u in on_page]
+        header = {
+            "authors": authors,
+            "depth": depth,
+            "total_nodes": len(hood.nodes),
+            "total_edges": len(hood.edges),
+            "trimmed_nodes": hood.trimmed_nodes,
+            "trimmed_edges": hood.trimmed_edges,
+            "limit": limit,
+            "offset": offset,
+        }
+
+        def node_records() -> Iterator[dict]:
+            for node in page:
+                yield {
+                    "name": node,
+                    "degree": graph.degree(node),
+                    "member": node in group.members,
+                }
+
+        def edge_records() -> Iterator[dict]:
+            for u, v in edges:
+                yield {"source": u, "target": v, "weight": graph[u][v]["weight"]}
+
+        if wants_ndjson():
+
+            def lines() -> Iterator[str]:
+                yield json.dumps({"type": "header", **header}) + "\n"
+                for record in node_records():
+                    yield json.dumps({"type": "node", **record}) + "\n"
+                for record in edge_records():
+                    yield json.dumps({"type": "edge", **record}) + "\n"
+
+            return Response(lines(), mimetype=NDJSON)
+        return jsonify(**header, nodes=list(node_records()), edges=list(edge_records()))
+
+    @api.get("/<key>/path")
+    def path(key: str):
+        """Shortest coauthor chain between two authors within the group."""
+        group = dataset(key)
+        source = resolve(request.args.get("source"), "source")
+        target = resolve(request.args.get("target"), "target")
+        try:
+            nodes = nx.shortest_path(group.graph, source, target)
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            abort(404, f"no path between {source!r} and {target!r}")
+        return jsonify(
+            source=source,
+            target=target,
+            length=len(nodes) - 1,
+            path=nodes,
+            weights=[group.graph[u][v]["weight"] for u, v in zip(nodes, nodes[1:])],
+        )
+
+    return api
@@ -0,0 +1,121 @@
+"""Network elements for layout and rendering in the browser.
+
+Instead of running spring_layout on the server and sending a drawn figure,
+the browser layout mode sends the nodes and edges of a sub-network with seed
+positions (the group's cached layout, new nodes at their neighbors'
+centroid) and lets cytoscape.js run a force-directed layout from there. The
+figures built by `graphing.build_network` remain the default and fallback.
+"""
+
+from typing import Iterable
+
+import networkx as nx
+
+from utils import graphing
+
+# force-directed layout run in the browser, started from the seed positions
+BROWSER_ITERATIONS = 250
+NODE_SIZE = 12
+
+STYLESHEET = [
+    {
+        "selector": "node",
+        "style": {
+            "width": NODE_SIZE,
+            "height": NODE_SIZE,
+            "background-color": graphing.NODE_COLOR,
+        },
+    },
+    {
+        "selector": "node[?focus], node:selected",
+        "style": {"label": "data(name)", "font-size": 24},
+    },
+    {
+        "selector": "node[?shared]",
+        "style": {"background-color": graphing.SHARED_COLOR},
+    },
+    {
+        "selector": "node[?focus]",
+        "style": {"background-color": graphing.FOCUS_COLOR},
+    },
+    {
+        "selector": "edge",
+        "style": {"line-color": "#999999", "curve-style": "haystack"},
+    },
+] + [
+    {"selector": f"edge[weight >= {min_weight}]", "style": {"width": width}}
+    for min_weight, width in graphing.EDGE_WIDTHS
+]
+
+
+def elements(
+    graph: nx.Graph,
+    seeds: nx.layout,
+    focus: Iterable[str] = (),
+    shared: Iterable[str] = (),
+) -> list[dict]:
+    """Lists a graph's nodes and edges as cytoscape elements.
+
+    Nodes are identified by their position in the graph so that edges do not
+    repeat author names, and the weight of single publication edges is left
+    out. Seed positions are scaled like compact figures, to integers on a
+    1/COORD_SCALE grid; y is flipped since screen coordinates grow downwards.
+
+    Args:
+        graph (nx.Graph): graph to draw.
+        seeds (nx.layout): starting position of every node.
+        focus (Iterable[str], optional): authors to highlight. Defaults to ().
+        shared (Iterable[str], optional): coauthors shared by several focused
+            authors. Defaults to ().
+
+    Returns:
+        list[dict]: node elements followed by edge elements.
+    """
+    focus = set(focus)
+    shared = set(shared)
+    ids = {}
+    nodes = []
+    for node in graph:
+        ids[node] = str(len(ids))
+        x, y = seeds[node]
+        data = {"id": ids[node], "name": node}
+        if node in focus:
+            data["focus"] = 1
+        elif node in shared:
+            data["shared"] = 1
+        nodes.append(
+            {
+                "data": data,
+                "position": {
+                    "x": int(round(float(x) * graphing.COORD_SCALE)),
+                    "y": -int(round(float(y) * graphing.COORD_SCALE)),
+                },
+            }
+        )
+    edges = []
+    for u, v, weight in graph.edges(data="weight", default=1):
+        data = {"source": ids[u], "target": ids[v]}
+        if weight > 1:
+            data["weight"] = weight
+        edges.append({"data": data})
+    return nodes + edges
+
+
+def layout(iterations: int = BROWSER_ITERATIONS) -> dict:
+    """Force-directed cytoscape layout starting from the elements' positions.
+
+    Args:
+        iterations (int, optional): layout iterations run in the browser.
+            Defaults to BROWSER_ITERATIONS.
+
+    Returns:
+        dict: cytoscape layout options.
+    """
+    return {
+        "name": "cose",
+        "randomize": False,
+        "animate": False,
+        "numIter": iterations,
+        "fit": True,
+        "padding": 20,
+    }
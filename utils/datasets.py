@@ -0,0 +1,793 @@
+"""Dataset registry.
+
+Every group (COP, IPOP, SURE, ...) is a membership-filtered view over one
+member graph, the edges of the base co-authorship graph that touch a scholar
+of any group, so edges are stored once no matter how many groups are
+configured. The rest of the base graph, mostly edges between two coauthors,
+is only held as the CSR arrays of the adjacency index, which the pair, team
+and hop views expand. Adding a new department only requires a new
+`DatasetConfig` entry in `DATASETS`.
+"""
+
+import csv
+import functools
+import json
+import os
+import random
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Iterator, Union
+
+import networkx as nx
+import numpy as np
+import plotly.graph_objects as go
+
+from utils import (
+    adjacency,
+    cytoscape,
+    graphing,
+    journals,
+    layout,
+    metrics,
+    overlap,
+    pipeline,
+    search,
+    store,
+    utils,
+)
+
+BASE_GRAPH_FILE = "data/full_graph.pkl"
+MEMBER_GRAPH_FILE = "data/member-graph.pkl"
+ADJACENCY_FILE = "data/adjacency.npz"
+PUBLICATION_FILES = ["data/scraped.json", "data/scraped_sure.json"]
+# larger multi-author selections are drawn from a reproducible sample
+MAX_TEAM = 25
+# team figures kept in memory by each worker
+TEAM_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    """Static description of a group of scholars.
+
+    Attributes:
+        key (str): short identifier, used in component ids and file names
+        label (str): display name of the group
+        scholars_file (str): csv file listing the group's scholars
+        positions_file (str): file caching the group's spring_layout positions
+        name_fields (tuple[str, ...]): csv columns joined to form a scholar's name
+        logo (Union[str, None]): asset shown in place of the tab description
+    """
+
+    key: str
+    label: str
+    scholars_file: str
+    positions_file: str
+    name_fields: tuple[str, ...] = ("Name",)
+    logo: Union[str, None] = None
+
+    @property
+    def figure_file(self) -> str:
+        """File holding the pre-serialized figure of the entire group network."""
+        return f"data/{self.key}-figure.json"
+
+    @property
+    def metrics_file(self) -> str:
+        """File holding the group's network metrics."""
+        return f"data/{self.key}-metrics.json"
+
+    @property
+    def overlap_file(self) -> str:
+        """File holding the group's shared coauthor matrix."""
+        return f"data/{self.key}-overlap.npz"
+
+
+DATASETS = [
+    DatasetConfig(
+        key="cop",
+        label="COP",
+        scholars_file="data/COPscholars.csv",
+        positions_file="data/cop-graph-positions.pkl",
+    ),
+    DatasetConfig(
+        key="ipop",
+        label="IPOP",
+        scholars_file="data/IPOP-Scholars.csv",
+        positions_file="data/ipop-graph-positions.pkl",
+    ),
+    DatasetConfig(
+        key="sure",
+        label="SURE",
+        scholars_file="data/SUREscholars.csv",
+        positions_file="data/sure-graph-positions.pkl",
+        name_fields=("First", "Last"),
+        logo="/assets/sure_logo.PNG",
+    ),
+]
+
+
+def load_scholar_names(config: DatasetConfig) -> list[str]:
+    """Loads a group's scholars from file.
+
+    Args:
+        config (DatasetConfig): group to load.
+
+    Returns:
+        list[str]: A list of scholar names.
+    """
+    with open(config.scholars_file, "r", encoding="utf-8-sig") as f:
+        csvreader = csv.DictReader(f)
+        authors = []
+        for row in csvreader:
+            authors.append(
+                " ".join(row.get(field, "").strip() for field in config.name_fields)
+            )
+        return authors
+
+
+def name_key(name: str) -> str:
+    """Normalizes a name for identity matching against graph nodes.
+
+    Args:
+        name (str): scholar or node name.
+
+    Returns:
+        str: case-insensitive 2-part name, empty if the name has no words.
+    """
+    if not name.split():
+        return ""
+    return utils.parse_name(name).casefold()
+
+
+def node_keys(nodes: Iterable[str]) -> dict[str, str]:
+    """Maps normalized names to node names.
+
+    Args:
+        nodes (Iterable[str]): node names, e.g. a graph.
+
+    Returns:
+        dict[str, str]: `name_key` of every node to the node name.
+    """
+    return {name_key(node): node for node in nodes}
+
+
+def resolve_members(names: list[str], keys: dict[str, str]) -> set[str]:
+    """Resolves scholar names to the graph nodes that represent them.
+
+    Args:
+        names (list[str]): scholar names, e.g. from a csv.
+        keys (dict[str, str]): lookup from `node_keys`.
+
+    Returns:
+        set[str]: node names, scholars without any coauthor are left out.
+    """
+    return {keys[key] for key in map(name_key, names) if key in keys}
+
+
+def member_graph(graph: nx.Graph, members: set[str]) -> nx.Graph:
+    """Copies the edges touching any member, with their attributes.
+
+    Args:
+        graph (nx.Graph): base graph.
+        members (set[str]): node names of every group's scholars.
+
+    Returns:
+        nx.Graph: the members, their coauthors and the edges between them
+        that touch a member.
+    """
+    edges = [(u, v) for u, v in graph.edges(members) if u in members or v in members]
+    return graph.edge_subgraph(edges).copy()
+
+
+def group_view(graph: nx.Graph, members: set[str]) -> nx.Graph:
+    """Creates a read-only view of the edges touching any member.
+
+    No edges are copied, the view filters the graph lazily.
+
+    Args:
+        graph (nx.Graph): base or member graph.
+        members (set[str]): node names belonging to the group.
+
+    Returns:
+        nx.Graph: subgraph view of the members and their direct coauthors.
+    """
+    nodes = set(members)
+    for member in members:
+        nodes.update(graph[member])
+    return nx.subgraph_view(
+        graph,
+        filter_node=nodes.__contains__,
+        filter_edge=lambda u, v: u in members or v in members,
+    )
+
+
+def group_figure(graph: nx.Graph, positions: nx.layout, label: str) -> go.Figure:
+    """Draws the entire network of a group.
+
+    Args:
+        graph (nx.Graph): group view of the base graph.
+        positions (nx.layout): the group's positions.
+        label (str): display name of the group.
+
+    Returns:
+        go.Figure: drawn network graph
+    """
+    node_trace, edge_traces = graphing.build_network(graph, positions)
+    return graphing.draw_network(
+        node_trace, edge_traces, title=f"{label} Network Graph"
+    )
+
+
+class Dataset:
+    """A group of scholars viewed through the shared member graph."""
+
+    def __init__(self, config: DatasetConfig, registry: "Registry"):
+        self.config = config
+        self.registry = registry
+        self.names = load_scholar_names(config)
+        self.members = resolve_members(self.names, registry.node_keys)
+        self.graph = group_view(registry.base, self.members)
+
+    @cached_property
+    def positions(self) -> nx.layout:
+        """Group-specific spring_layout positions, computed once if not on file."""
+        if os.path.exists(self.config.positions_file):
+            return utils.load_positions(self.config.positions_file)
+        return utils.save_positions(self.graph, self.config.positions_file)
+
+    @cached_property
+    def figure(self) -> Union[go.Figure, dict]:
+        """Figure of the entire group network, pre-serialized by the build if available."""
+        if os.path.exists(self.config.figure_file):
+            with open(self.config.figure_file, "r") as f:
+                return json.load(f)
+        return group_figure(self.graph, self.positions, self.config.label)
+
+    @cached_property
+    def overlap(self) -> overlap.Overlap:
+        """Shared coauthor counts between the group's scholars."""
+        if os.path.exists(self.config.overlap_file):
+            return overlap.Overlap.load(self.config.overlap_file)
+        return overlap.Overlap.from_graph(self.registry.base, self.members)
+
+    @cached_property
+    def overlap_figure(self) -> go.Figure:
+        """Heatmap of the shared coauthor counts between the group's scholars."""
+        return graphing.draw_heatmap(
+            self.overlap.names,
+            self.overlap.matrix.toarray().tolist(),
+            f"{self.config.label} Shared Coauthors",
+        )
+
+    def top_overlap(self, name: str, limit: int = 10) -> list[tuple[str, int]]:
+        """Finds the group's scholars sharing the most coauthors with an author.
+
+        Args:
+            name (str): author name as typed or listed.
+            limit (int, optional): maximum colleagues returned. Defaults to 10.
+
+        Returns:
+            list[tuple[str, int]]: colleague and number of shared coauthors.
+        """
+        return self.overlap.top(self.registry.resolve(name), limit)
+
+    @cached_property
+    def edges(self) -> tuple[np.ndarray, list[tuple[str, str]]]:
+        """Sorted ids of the group's edges and the matching node pairs."""
+        edges = sorted((i, u, v) for u, v, i in self.graph.edges(data="id", default=-1))
+        ids = np.array([i for i, _, _ in edges], dtype=np.int32)
+        return ids, [(u, v) for _, u, v in edges]
+
+    @cached_property
+    def edge_mask(self) -> np.ndarray:
+        """Boolean mask over base edge ids, True for the group's edges."""
+        mask = np.zeros(self.registry.edge_count, dtype=bool)
+        mask[self.edges[0]] = True
+        return mask
+
+    @cached_property
+    def journal_counts(self) -> dict[str, int]:
+        """Number of group edges per journal key."""
+        return self.registry.journals.counts(self.edge_mask)
+
+    @cached_property
+    def metrics(self) -> dict:
+        """Network metrics of the group, computed by the build if available."""
+        if os.path.exists(self.config.metrics_file):
+            with open(self.config.metrics_file, "r") as f:
+                return json.load(f)
+        return metrics.group_metrics(self.graph, self.members)
+
+    def journal_options(
+        self, search_value: Union[str, None] = None, limit: int = search.SEARCH_LIMIT
+    ) -> list[dict[str, str]]:
+        """Dropdown options for the journals appearing in the group.
+
+        Args:
+            search_value (Union[str, None], optional): typed text, only journals
+                containing it are listed. Defaults to None.
+            limit (int, optional): maximum options returned.
+                Defaults to search.SEARCH_LIMIT.
+
+        Returns:
+            list[dict[str, str]]: options, most connected journals first.
+        """
+        query = journals.journal_key(search_value or "")
+        options = []
+        for key, _ in sorted(
+            self.journal_counts.items(), key=lambda item: (-item[1], item[0])
+        ):
+            if query in key:
+                options.append(self.journal_option(key))
+                if len(options) == limit:
+                    break
+        return options
+
+    def journal_option(self, key: str) -> dict[str, str]:
+        """Dropdown option of a journal, labeled with its number of group edges."""
+        label = self.registry.journals.labels.get(key, key)
+        return {"label": f"{label} ({self.journal_counts.get(key, 0)})", "value": key}
+
+    def journal_subgraph(self, journal_titles: Iterable[str]) -> nx.Graph:
+        """Filters the group network to edges published in any of the journals.
+
+        This is an intersection of sorted edge id arrays, the publications
+        are not rescanned.
+
+        Args:
+            journal_titles (Iterable[str]): journal titles or keys to keep.
+
+        Returns:
+            nx.Graph: edge subgraph view of the group network.
+        """
+        ids = self.registry.journals.edge_ids(journal_titles)
+        group_ids, pairs = self.edges
+        _, found, _ = np.intersect1d(
+            group_ids, ids, assume_unique=True, return_indices=True
+        )
+        return self.registry.base.edge_subgraph(pairs[i] for i in found)
+
+    def journal_figure(self, journal_titles: Iterable[str]) -> go.Figure:
+        """Draws the group network restricted to the given journals.
+
+        Node positions are the group's cached positions, so the filtered
+        view lines up with the full network.
+
+        Args:
+            journal_titles (Iterable[str]): journal titles or keys to keep.
+
+        Returns:
+            go.Figure: drawn network graph
+        """
+        journal_titles = list(journal_titles)
+        graph = self.journal_subgraph(journal_titles)
+        node_trace, edge_traces = graphing.build_network(graph, self.positions)
+        return graphing.draw_network(
+            node_trace,
+            edge_traces,
+            title=f"{self.config.label} Network Graph ({len(journal_titles)} journals)",
+        )
+
+    def pair_figure(
+        self,
+        name1: Union[str, None],
+        name2: Union[str, None],
+        journal_titles: Union[Iterable[str], None] = None,
+        depth: int = 1,
+    ) -> Union[go.Figure, dict]:
+        """Draws a graph, given two scholars to filter the network on.
+
+        Unfiltered figures are served from the pre-rendered figure store when
+        `prerender.py` has rendered them, and drawn live otherwise.
+
+        Args:
+            name1 (Union[str, None]): first scholar name to filter on
+            name2 (Union[str, None]): second scholar name to filter on
+            journal_titles (Union[Iterable[str], None], optional): only keep
+                edges published in these journals. Defaults to None.
+            depth (int, optional): number of coauthor hops. Defaults to 1.
+
+        Returns:
+            Union[go.Figure, dict]: drawn network graph
+        """
+        a1 = self.registry.resolve(name1) if name1 else None
+        a2 = self.registry.resolve(name2) if name2 else None
+        title = pair_title(name1, name2)
+        authors = [a for a in (a1, a2) if a is not None]
+        if not journal_titles:
+            stored = self.registry.figures.get(authors, depth)
+            if stored is not None:
+                figure, details = stored
+                figure["layout"]["title"]["text"] = title + details
+                return figure
+        figure, _ = render_pair(self.registry, a1, a2, depth, journal_titles, title)
+        return figure
+
+    def pair_elements(
+        self,
+        name1: Union[str, None],
+        name2: Union[str, None],
+        journal_titles: Union[Iterable[str], None] = None,
+        depth: int = 1,
+    ) -> dict:
+        """Lists the network of two scholars for layout in the browser.
+
+        No layout is run on the server: nodes are seeded with the group's
+        cached positions, nodes outside the group start at the centroid of
+        their placed neighbors.
+
+        Args:
+            name1 (Union[str, None]): first scholar name to filter on
+            name2 (Union[str, None]): second scholar name to filter on
+            journal_titles (Union[Iterable[str], None], optional): only keep
+                edges published in these journals. Defaults to None.
+            depth (int, optional): number of coauthor hops. Defaults to 1.
+
+        Returns:
+            dict: cytoscape elements, layout and title.
+        """
+        authors = [
+            author
+            for author in (
+                self.registry.resolve(name) for name in (name1, name2) if name
+            )
+            if author is not None
+        ]
+        graph, hood = self.registry.neighborhood(authors, depth, journal_titles)
+        seeds, _ = layout.initial_positions(graph, self.positions, seed=0)
+        return {
+            "elements": cytoscape.elements(graph, seeds, authors),
+            "layout": cytoscape.layout(),
+            "title": pair_title(name1, name2) + neighborhood_details(hood, depth),
+        }
+
+    def team_figure(
+        self,
+        names: Iterable[str],
+        journal_titles: Union[Iterable[str], None] = None,
+        depth: int = 1,
+    ) -> Union[go.Figure, dict]:
+        """Draws the union of several scholars' networks.
+
+        Unfiltered figures are kept in the registry's bounded team figure
+        cache under the sorted author set, so any selection order is drawn
+        once per worker.
+
+        Args:
+            names (Iterable[str]): scholar names to filter on.
+            journal_titles (Union[Iterable[str], None], optional): only keep
+                edges published in these journals. Defaults to None.
+            depth (int, optional): number of coauthor hops. Defaults to 1.
+
+        Returns:
+            Union[go.Figure, dict]: drawn network graph
+        """
+        names = [name for name in names if name]
+        authors = self.resolve_team(names)
+        title = team_title(names)
+        if journal_titles:
+            figure, _ = render_team(
+                self.registry, authors, depth, journal_titles, title
+            )
+            return figure
+        payload, details = self.registry.team_figure(tuple(authors), depth)
+        figure = json.loads(payload)
+        figure["layout"]["title"]["text"] = title + details
+        return figure
+
+    def team_elements(
+        self,
+        names: Iterable[str],
+        journal_titles: Union[Iterable[str], None] = None,
+        depth: int = 1,
+    ) -> dict:
+        """Lists the union of several scholars' networks for layout in the browser.
+
+        Args:
+            names (Iterable[str]): scholar names to filter on.
+            journal_titles (Union[Iterable[str], None], optional): only keep
+                edges published in these journals. Defaults to None.
+            depth (int, optional): number of coauthor hops. Defaults to 1.
+
+        Returns:
+            dict: cytoscape elements, layout and title.
+        """
+        names = [name for name in names if name]
+        authors = self.resolve_team(names)
+        team = sample_team(authors)
+        graph, hood = self.registry.neighborhood(team, depth, journal_titles)
+        seeds, _ = layout.initial_positions(graph, self.positions, seed=0)
+        return {
+            "elements": cytoscape.elements(graph, seeds, team, hood.shared),
+            "layout": cytoscape.layout(),
+            "title": team_title(names) + team_details(hood, depth, len(authors)),
+        }
+
+    def resolve_team(self, names: Iterable[str]) -> list[str]:
+        """Sorted, distinct node names of the scholars with coauthors."""
+        return sorted(
+            {
+                author
+                for author in (self.registry.resolve(name) for name in names)
+                if author is not None
+            }
+        )
+
+
+def pair_title(name1: Union[str, None], name2: Union[str, None]) -> str:
+    """Title of a pair network, "..." standing for a missing scholar."""
+    return f"{name1.title() if name1 else '...'} x {name2.title() if name2 else '...'} Network Graph"
+
+
+def render_pair(
+    registry: "Registry",
+    author1: Union[str, None],
+    author2: Union[str, None],
+    depth: int = 1,
+    journal_titles: Union[Iterable[str], None] = None,
+    title: str = "",
+) -> tuple[go.Figure, str]:
+    """Draws the neighborhood of one or two authors.
+
+    The sub-network is a budgeted breadth-first expansion over the base
+    graph's adjacency index rather than a rebuild from the publications.
+
+    Args:
+        registry (Registry): registry holding the base graph.
+        author1 (Union[str, None]): node name of the first author.
+        author2 (Union[str, None]): node name of the second author.
+        depth (int, optional): number of coauthor hops. Defaults to 1.
+        journal_titles (Union[Iterable[str], None], optional): only keep
+            edges published in these journals. Defaults to None.
+        title (str, optional): title, followed by the neighborhood details.
+            Defaults to "".
+
+    Returns:
+        tuple[go.Figure, str]: drawn network graph and the neighborhood details.
+    """
+    graph, hood = registry.neighborhood(
+        [a for a in (author1, author2) if a is not None], depth, journal_titles
+    )
+    positions = nx.spring_layout(graph)
+    node_trace, edge_traces = graphing.build_network(
+        graph, positions, [author1, author2]
+    )
+    details = neighborhood_details(hood, depth)
+    figure = graphing.draw_network(node_trace, edge_traces, title=title + details)
+    return figure, details
+
+
+def sample_team(authors: list[str], limit: int = MAX_TEAM) -> list[str]:
+    """Keeps at most `limit` authors.
+
+    The sample is seeded with the sorted author set, so a selection is
+    always drawn the same way, whatever its order and in every worker.
+
+    Args:
+        authors (list[str]): node names of the selected authors.
+        limit (int, optional): maximum authors kept. Defaults to MAX_TEAM.
+
+    Returns:
+        list[str]: sorted node names kept.
+    """
+    authors = sorted(set(authors))
+    if len(authors) <= limit:
+        return authors
+    return sorted(random.Random("\n".join(authors)).sample(authors, limit))
+
+
+def render_team(
+    registry: "Registry",
+    authors: list[str],
+    depth: int = 1,
+    journal_titles: Union[Iterable[str], None] = None,
+    title: str = "",
+) -> tuple[go.Figure, str]:
+    """Draws the union of several authors' neighborhoods.
+
+    The selected authors (sampled down to MAX_TEAM) seed a single budgeted
+    expansion over the adjacency index rather than one per author or pair.
+    Coauthors shared by several selected authors are drawn in
+    `graphing.SHARED_COLOR`.
+
+    Args:
+        registry (Registry): registry holding the base graph.
+        authors (list[str]): node names of the selected authors.
+        depth (int, optional): number of coauthor hops. Defaults to 1.
+        journal_titles (Union[Iterable[str], None], optional): only keep
+            edges published in these journals. Defaults to None.
+        title (str, optional): title, followed by the neighborhood details.
+            Defaults to "".
+
+    Returns:
+        tuple[go.Figure, str]: drawn network graph and the neighborhood details.
+    """
+    team = sample_team(authors)
+    graph, hood = registry.neighborhood(team, depth, journal_titles)
+    positions = nx.spring_layout(graph)
+    node_trace, edge_traces = graphing.build_network(
+        graph, positions, team, shared=hood.shared
+    )
+    details = team_details(hood, depth, len(set(authors)))
+    figure = graphing.draw_network(node_trace, edge_traces, title=title + details)
+    return figure, details
+
+
+def team_title(names: list[str]) -> str:
+    """Title of a multi-author network, naming the first few scholars."""
+    shown = ", ".join(name.title() for name in names[:3])
+    more = f" + {len(names) - 3} more" if len(names) > 3 else ""
+    return f"{shown}{more} Network Graph"
+
+
+def team_details(hood: adjacency.Neighborhood, depth: int, selected: int) -> str:
+    """Describes a multi-author neighborhood for a figure title.
+
+    Args:
+        hood (adjacency.Neighborhood): expanded neighborhood.
+        depth (int): number of hops expanded.
+        selected (int): number of authors selected before sampling.
+
+    Returns:
+        str: e.g. " (12 shared coauthors, 25 of 40 authors sampled, 2 hops)".
+    """
+    details = [f"{len(hood.shared):,} shared coauthors"]
+    if selected > MAX_TEAM:
+        details.append(f"{MAX_TEAM} of {selected} authors sampled")
+    return neighborhood_details(hood, depth, details)
+
+
+def neighborhood_details(
+    hood: adjacency.Neighborhood, depth: int, details: Iterable[str] = ()
+) -> str:
+    """Describes the depth and truncation of a neighborhood for a figure title.
+
+    Args:
+        hood (adjacency.Neighborhood): expanded neighborhood.
+        depth (int): number of hops expanded.
+        details (Iterable[str], optional): details listed first. Defaults to ().
+
+    Returns:
+        str: e.g. " (2 hops, 1,000 nodes shown, 312 more trimmed)", or "" for
+        an untrimmed direct neighborhood.
+    """
+    details = list(details)
+    if depth > 1:
+        details.append(f"{depth} hops")
+    if hood.trimmed_nodes:
+        details.append(
+            f"{len(hood.nodes):,} nodes shown, {hood.trimmed_nodes:,} more trimmed"
+        )
+    if hood.trimmed_edges:
+        details.append(f"{hood.trimmed_edges:,} edges trimmed")
+    return f" ({', '.join(details)})" if details else ""
+
+
+class Registry:
+    """Loads the member graph once and exposes every configured group.
+
+    The member graph and the adjacency index are published by the build; if
+    either is missing they are derived from the base graph, which then stays
+    loaded only while they are computed.
+    """
+
+    def __init__(
+        self,
+        configs: list[DatasetConfig] = DATASETS,
+        base_file: str = BASE_GRAPH_FILE,
+        journal_file: str = journals.JOURNAL_INDEX_FILE,
+        member_file: str = MEMBER_GRAPH_FILE,
+        adjacency_file: str = ADJACENCY_FILE,
+    ):
+        if os.path.exists(member_file) and os.path.exists(adjacency_file):
+            self.adjacency = adjacency.AdjacencyIndex.load(adjacency_file)
+            self.node_keys = node_keys(self.adjacency.names)
+            self.base = utils.load_graph(member_file)
+        else:
+            graph = utils.load_graph(base_file)
+            self.adjacency = adjacency.AdjacencyIndex.from_graph(graph)
+            self.node_keys = node_keys(self.adjacency.names)
+            members = set().union(
+                *(
+                    resolve_members(load_scholar_names(config), self.node_keys)
+                    for config in configs
+                )
+            )
+            self.base = member_graph(graph, members)
+        self.journals = journals.JournalIndex.load(journal_file)
+        self.edge_count = self.adjacency.edge_count
+        self.search_index = search.PrefixIndex(
+            self.adjacency.names,
+            dict(zip(self.adjacency.names, self.adjacency.degree.tolist())),
+        )
+        self.digest = pipeline.file_digest(base_file)
+        self.figures = store.FigureStore(store.FIGURE_STORE_DIR, self.digest)
+        # rendered team figures, see `Registry.team_figure`
+        self.team_figure = functools.lru_cache(maxsize=TEAM_CACHE_SIZE)(
+            self.render_team
+        )
+        self.datasets = {config.key: Dataset(config, self) for config in configs}
+
+    def __getitem__(self, key: str) -> Dataset:
+        return self.datasets[key]
+
+    def __iter__(self) -> Iterator[Dataset]:
+        return iter(self.datasets.values())
+
+    def resolve(self, name: str) -> Union[str, None]:
+        """Finds the graph node matching a scholar name.
+
+        Args:
+            name (str): scholar name, e.g. from a csv or dropdown.
+
+        Returns:
+            Union[str, None]: node name, or None if the scholar has no coauthors.
+        """
+        return self.node_keys.get(name_key(name))
+
+    def neighborhood(
+        self,
+        nodes: list[str],
+        depth: int = 1,
+        journal_titles: Union[Iterable[str], None] = None,
+        max_nodes: int = adjacency.MAX_NODES,
+        max_edges: int = adjacency.MAX_EDGES,
+        within: Union[np.ndarray, None] = None,
+    ) -> tuple[nx.Graph, adjacency.Neighborhood]:
+        """Expands nodes up to `depth` hops within a node and edge budget.
+
+        Args:
+            nodes (list[str]): node names to start from.
+            depth (int, optional): number of hops. Defaults to 1.
+            journal_titles (Union[Iterable[str], None], optional): only follow
+                edges published in these journals. Defaults to None.
+            max_nodes (int, optional): node budget. Defaults to adjacency.MAX_NODES.
+            max_edges (int, optional): edge budget. Defaults to adjacency.MAX_EDGES.
+            within (Union[np.ndarray, None], optional): boolean mask over edge
+                ids, e.g. `Dataset.edge_mask`, only these edges are followed.
+                Defaults to None.
+
+        Returns:
+            tuple[nx.Graph, adjacency.Neighborhood]: weighted graph of the kept
+            nodes and edges, and the expansion result.
+        """
+        allowed = within
+        if journal_titles:
+            allowed = np.zeros(self.edge_count, dtype=bool)
+            allowed[self.journals.edge_ids(journal_titles)] = True
+            if within is not None:
+                allowed &= within
+        hood = self.adjacency.neighborhood(
+            nodes, depth, max_nodes, max_edges, allowed_edges=allowed
+        )
+        return hood.graph(), hood
+
+    def render_team(self, authors: tuple[str, ...], depth: int) -> tuple[str, str]:
+        """Draws an unfiltered team figure for the team figure cache.
+
+        Called through `team_figure`, an LRU cache of TEAM_CACHE_SIZE entries
+        keyed by the sorted author set and depth. Figures are cached as
+        serialized json, which is far smaller than plotly objects.
+
+        Args:
+            authors (tuple[str, ...]): sorted node names of the selected authors.
+            depth (int): number of coauthor hops.
+
+        Returns:
+            tuple[str, str]: figure json and the neighborhood details.
+        """
+        figure, details = render_team(self, list(authors), depth)
+        return graphing.figure_json(figure), details
+
+    def search(self, query: str, limit: int = search.SEARCH_LIMIT) -> list[str]:
+        """Typeahead over every node name, most connected first.
+
+        Args:
+            query (str): typed text.
+            limit (int, optional): maximum matches returned.
+                Defaults to search.SEARCH_LIMIT.
+
+        Returns:
+            list[str]: matching node names.
+        """
+        return self.search_index.search(query, limit)
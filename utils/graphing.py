@@ -1,33 +1,101 @@
-from typing import Union
+from typing import Iterable
+import base64
+import gzip
+import json
+import os
+import re
+
+import dash
+import numpy as np
 import plotly.graph_objects as go
 import plotly.io as pio
 import networkx as nx
 
 pio.templates.default = "plotly_white"
 
+# (minimum edge weight, line width), one edge trace is drawn per bucket
+EDGE_WIDTHS = ((1, 0.25), (2, 0.75), (5, 1.5))
+
+# compact figures send coordinates as integers on a 1/COORD_SCALE grid (the
+# axes are hidden, only relative positions matter), node degrees as numbers,
+# and color nodes through a two-color scale
+COMPACT = os.getenv("COMPACT_FIGURES", "1") != "0"
+COORD_SCALE = 1000
+NODE_COLOR = "#000000"
+FOCUS_COLOR = "#ff0000"
+SHARED_COLOR = "#1f77b4"
+# first plotly.js release decoding {"dtype", "bdata"} typed arrays
+TYPED_ARRAY_PLOTLY_JS = (2, 28, 0)
+
+
+def plotly_js_version() -> tuple[int, ...]:
+    """Version of the plotly.js bundled with dash-core-components.
+
+    Returns:
+        tuple[int, ...]: e.g. (2, 13, 3), or () if it cannot be read.
+    """
+    fpath = os.path.join(os.path.dirname(dash.__file__), "dcc", "plotly.min.js")
+    try:
+        with open(fpath, "r") as f:
+            found = re.search(r"v(\d+)\.(\d+)\.(\d+)", f.read(512))
+    except OSError:
+        return ()
+    return tuple(int(part) for part in found.groups()) if found else ()
+
+
+TYPED_ARRAYS = plotly_js_version() >= TYPED_ARRAY_PLOTLY_JS
+
+
+def edge_width(weight: int) -> float:
+    """Maps an edge weight (number of shared publications) to a line width.
+
+    Args:
+        weight (int): edge weight.
+
+    Returns:
+        float: line width of the weight's bucket.
+    """
+    width = EDGE_WIDTHS[0][1]
+    for min_weight, bucket_width in EDGE_WIDTHS:
+        if weight >= min_weight:
+            width = bucket_width
+    return width
+
 
 def build_network(
     graph: nx.Graph,
     layout: nx.layout,
-    focus1: Union[str, None] = None,
-    focus2: Union[str, None] = None,
-) -> tuple[go.Scatter, go.Scatter]:
+    focus: Iterable[str] = (),
+    shared: Iterable[str] = (),
+    compact: bool = COMPACT,
+) -> tuple[go.Scatter, list[go.Scatter]]:
     """Generates a network scatterplot's data structure.
 
     Args:
         graph (nx.Graph): networkx graph to be drawn
         layout (nx.layout): layout in which to visualize the graph
-        focus1 (Union[str, None], optional): author to highlight. Defaults to None.
-        focus2 (Union[str, None], optional): author to highlight. Defaults to None.
+        focus (Iterable[str], optional): authors to highlight. Defaults to ().
+        shared (Iterable[str], optional): coauthors shared by several focused
+            authors, drawn in SHARED_COLOR. Defaults to ().
+        compact (bool, optional): quantize coordinates to integers and send
+            numbers instead of per-node strings and colors. Defaults to COMPACT.
 
     Returns:
-        tuple[go.Scatter, go.Scatter]: Plotly Scatter graph object traces.
+        tuple[go.Scatter, list[go.Scatter]]: Plotly Scatter node trace and one
+        edge trace per line width.
     """
-    edge_x = []
-    edge_y = []
-    for edge in graph.edges():
-        x0, y0 = layout[edge[0]]
-        x1, y1 = layout[edge[1]]
+    focus = set(focus)
+    shared = set(shared)
+    if compact:
+        layout = {
+            node: [int(round(float(c) * COORD_SCALE)) for c in xy]
+            for node, xy in layout.items()
+        }
+    edge_xy = {width: ([], []) for _, width in EDGE_WIDTHS}
+    for u, v, weight in graph.edges(data="weight", default=1):
+        x0, y0 = layout[u]
+        x1, y1 = layout[v]
+        edge_x, edge_y = edge_xy[edge_width(weight)]
         edge_x.append(x0)
         edge_x.append(x1)
         edge_x.append(None)
@@ -35,13 +103,17 @@ def build_network(
         edge_y.append(y1)
         edge_y.append(None)
 
-    edge_trace = go.Scatter(
-        x=edge_x,
-        y=edge_y,
-        line=dict(width=0.25, color="#999999"),
-        hoverinfo="none",
-        mode="lines",
-    )
+    edge_traces = [
+        go.Scatter(
+            x=edge_x,
+            y=edge_y,
+            line=dict(width=width, color="#999999"),
+            hoverinfo="none",
+            mode="lines",
+        )
+        for width, (edge_x, edge_y) in edge_xy.items()
+        if edge_x
+    ]
 
     node_x = []
     node_y = []
@@ -50,7 +122,7 @@ def build_network(
         x, y = layout[node]
         node_x.append(x)
         node_y.append(y)
-        if node == focus1 or node == focus2:
+        if node in focus:
             node_name.append(f"**{node}**")
         else:
             node_name.append(node)
@@ -59,14 +131,18 @@ def build_network(
     node_text = []
     for node, adjacencies in enumerate(graph.adjacency()):
         n_info = len(adjacencies[1])
-        if (
-            adjacencies[0] == str(focus1).title()
-            or adjacencies[0] == str(focus2).title()
-        ):
-            node_adjacencies.append("#ff0000")
+        if adjacencies[0] in focus:
+            color = (1, FOCUS_COLOR)
+        elif adjacencies[0] in shared:
+            color = (0.5, SHARED_COLOR)
+        else:
+            color = (0, NODE_COLOR)
+        if compact:
+            node_adjacencies.append(color[0])
+            node_text.append(n_info)
         else:
-            node_adjacencies.append("#000000")
-        node_text.append(f"# of connections: {str(n_info)}")
+            node_adjacencies.append(color[1])
+            node_text.append(f"# of connections: {str(n_info)}")
 
     node_trace = go.Scatter(
         x=node_x,
@@ -75,27 +151,36 @@ def build_network(
         hoverinfo="text",
         hovertext=node_name,
         customdata=node_text,
-        hovertemplate="<b>%{hovertext}</b><br>%{customdata}<extra></extra>",
+        hovertemplate=(
+            "<b>%{hovertext}</b><br># of connections: %{customdata}<extra></extra>"
+            if compact
+            else "<b>%{hovertext}</b><br>%{customdata}<extra></extra>"
+        ),
     )
     node_trace.marker.color = node_adjacencies
-    return node_trace, edge_trace
+    if compact:
+        colorscale = [[0, NODE_COLOR], [1, FOCUS_COLOR]]
+        if shared:
+            colorscale.insert(1, [0.5, SHARED_COLOR])
+        node_trace.marker.update(colorscale=colorscale, cmin=0, cmax=1)
+    return node_trace, edge_traces
 
 
 def draw_network(
-    node_trace: go.Scatter, edge_trace: go.Scatter, title: str
+    node_trace: go.Scatter, edge_traces: list[go.Scatter], title: str
 ) -> go.Figure:
     """Draws network.
 
     Args:
         node_trace (go.Scatter): traces for where to draw nodes (points).
-        edge_trace (go.Scatter): traces for where to draw edges (lines).
+        edge_traces (list[go.Scatter]): traces for where to draw edges (lines).
         title (str): Title for the chart.
 
     Returns:
         go.Figure: plotly figure of drawn graph.
     """
     fig = go.Figure(
-        data=[edge_trace, node_trace],
+        data=[*edge_traces, node_trace],
         layout=go.Layout(
             title=title,
             titlefont_size=20,
@@ -120,3 +205,102 @@ def draw_network(
     fig.update_traces()
 
     return fig
+
+
+def pack_arrays(figure: dict) -> dict:
+    """Encodes the coordinates and node degrees as base64 typed arrays.
+
+    Only applied where plotly.js can decode them (TYPED_ARRAYS), otherwise
+    the figure is returned unchanged. Edge separators become NaN gaps.
+
+    Args:
+        figure (dict): figure json, e.g. from `go.Figure.to_plotly_json`.
+
+    Returns:
+        dict: the figure with its numeric arrays packed.
+    """
+    if not TYPED_ARRAYS:
+        return figure
+    for trace in figure["data"]:
+        for key, dtype in (("x", "f4"), ("y", "f4"), ("customdata", "u4")):
+            values = trace.get(key)
+            if values is None or not all(
+                v is None or isinstance(v, (int, float)) for v in values
+            ):
+                continue
+            array = np.array(
+                [np.nan if v is None else v for v in values],
+                dtype=np.float32 if dtype == "f4" else np.uint32,
+            )
+            trace[key] = {
+                "dtype": dtype,
+                "bdata": base64.b64encode(array.tobytes()).decode(),
+            }
+    return figure
+
+
+def figure_json(figure: go.Figure) -> str:
+    """Serializes a figure for storage, packing arrays when supported.
+
+    Args:
+        figure (go.Figure): figure to serialize.
+
+    Returns:
+        str: figure json.
+    """
+    if not TYPED_ARRAYS:
+        return figure.to_json()
+    return json.dumps(pack_arrays(json.loads(figure.to_json())))
+
+
+def payload_sizes(graph: nx.Graph, layout: nx.layout, served: str) -> dict[str, int]:
+    """Compares a served figure's size with the plain encoding of the network.
+
+    Args:
+        graph (nx.Graph): network drawn.
+        layout (nx.layout): positions of its nodes.
+        served (str): figure json as served.
+
+    Returns:
+        dict[str, int]: bytes of the plain (full precision, string customdata)
+        figure json, of the served json, and of the served json gzipped.
+    """
+    node_trace, edge_traces = build_network(graph, layout, compact=False)
+    full = draw_network(node_trace, edge_traces, title="").to_json()
+    return {
+        "full": len(full.encode()),
+        "served": len(served.encode()),
+        "served_gzip": len(gzip.compress(served.encode())),
+    }
+
+
+def draw_heatmap(names: list[str], counts: list[list[int]], title: str) -> go.Figure:
+    """Draws a square heatmap of counts between named scholars.
+
+    Args:
+        names (list[str]): row and column labels.
+        counts (list[list[int]]): square matrix of counts.
+        title (str): Title for the chart.
+
+    Returns:
+        go.Figure: plotly figure of the heatmap.
+    """
+    fig = go.Figure(
+        data=go.Heatmap(
+            z=counts,
+            x=names,
+            y=names,
+            colorscale="Blues",
+            colorbar=dict(title="Shared coauthors"),
+            hovertemplate="%{y}<br>%{x}<br>%{z} shared coauthors<extra></extra>",
+        ),
+        layout=go.Layout(
+            title=title,
+            titlefont_size=20,
+            height=800,
+            margin=dict(b=20, l=5, r=5, t=40),
+            xaxis=dict(showticklabels=False),
+            yaxis=dict(showticklabels=False, autorange="reversed"),
+        ),
+    )
+    return fig
@@ -0,0 +1,124 @@
+"""Journal to edge index.
+
+Every edge of the base graph carries an integer `id` attribute. The index maps
+each journal to the sorted array of edge ids it contributed, so filtering a
+network by journal is a set union over precomputed arrays instead of a rescan
+of the publications.
+"""
+
+import pickle
+from collections import defaultdict
+from typing import Iterable
+
+import numpy as np
+
+JOURNAL_INDEX_FILE = "data/journal-index.pkl"
+# longer "journal titles" are scraped abstracts or affiliations, not journals
+MAX_TITLE_LENGTH = 150
+
+
+def journal_key(title: str) -> str:
+    """Normalizes a journal title so spelling variants share one entry.
+
+    Args:
+        title (str): journal title as scraped.
+
+    Returns:
+        str: case-insensitive, whitespace-collapsed title.
+    """
+    return " ".join(title.split()).casefold()
+
+
+class JournalIndexBuilder:
+    """Accumulates journal to edge id postings during the graph build."""
+
+    def __init__(self):
+        self.labels: dict[str, str] = {}
+        self.postings: dict[str, set[int]] = defaultdict(set)
+
+    def add(self, title: str, edge_ids: Iterable[int]):
+        """Records the edges produced by a publication.
+
+        Titles longer than MAX_TITLE_LENGTH are not journals and are skipped.
+
+        Args:
+            title (str): journal title of the publication.
+            edge_ids (Iterable[int]): ids of the edges the publication produced.
+        """
+        key = journal_key(title)
+        if not key or len(key) > MAX_TITLE_LENGTH:
+            return
+        self.labels.setdefault(key, " ".join(title.split()))
+        self.postings[key].update(edge_ids)
+
+    def save(self, fpath: str = JOURNAL_INDEX_FILE):
+        """Saves the index as sorted int32 arrays.
+
+        Args:
+            fpath (str, optional): Destination file. Defaults to JOURNAL_INDEX_FILE.
+        """
+        postings = {
+            key: np.array(sorted(ids), dtype=np.int32)
+            for key, ids in self.postings.items()
+        }
+        with open(fpath, "wb") as f:
+            pickle.dump({"labels": self.labels, "postings": postings}, f)
+
+
+class JournalIndex:
+    """Read-only journal to edge id index."""
+
+    def __init__(self, labels: dict[str, str], postings: dict[str, np.ndarray]):
+        self.labels = labels
+        self.postings = postings
+
+    @classmethod
+    def load(cls, fpath: str = JOURNAL_INDEX_FILE) -> "JournalIndex":
+        """Loads the index from file.
+
+        Args:
+            fpath (str, optional): Source file. Defaults to JOURNAL_INDEX_FILE.
+
+        Returns:
+            JournalIndex: the loaded index.
+        """
+        with open(fpath, "rb") as f:
+            data = pickle.load(f)
+        return cls(data["labels"], data["postings"])
+
+    def edge_ids(self, journals: Iterable[str]) -> np.ndarray:
+        """Gets the sorted ids of the edges published in any of the journals.
+
+        Args:
+            journals (Iterable[str]): journal keys or titles.
+
+        Returns:
+            np.ndarray: sorted, unique edge ids.
+        """
+        arrays = [
+            self.postings[key]
+            for key in (journal_key(j) for j in journals)
+            if key in self.postings
+        ]
+        if not arrays:
+            return np.array([], dtype=np.int32)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.unique(np.concatenate(arrays))
+
+    def counts(self, mask: np.ndarray) -> dict[str, int]:
+        """Counts the edges of each journal that fall inside a group.
+
+        Args:
+            mask (np.ndarray): boolean array, True for edge ids in the group.
+
+        Returns:
+            dict[str, int]: journal key to number of group edges, journals
+            without any group edge are omitted.
+        """
+        counts = {}
+        for key, ids in self.postings.items():
+            n = int(np.count_nonzero(mask[ids]))
+            if n:
+                counts[key] = n
+        return counts
@@ -0,0 +1,318 @@
+"""Memory introspection of the serving process.
+
+Reports the process RSS over time, tracemalloc snapshots and their diffs
+between calls, the deep size of every object the registry holds and which
+lazy caches are filled. Everything is opt-in: the debug routes are only
+registered when `MEMORY_DEBUG=1`, since tracemalloc slows allocations down.
+Each gunicorn worker is its own process and reports only on itself.
+"""
+
+import collections
+import gc
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from typing import Any, Iterable, Union
+
+import numpy as np
+import pandas as pd
+from flask import Blueprint, jsonify, request
+
+from utils import datasets, pipeline
+
+# sampling period (seconds) and length of the RSS history
+RSS_INTERVAL = 10
+RSS_HISTORY = 360
+TRACEMALLOC_FRAMES = 1
+TOP_STATS = 25
+
+# never followed when measuring deep sizes, they are shared by everything
+_SKIP_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.FrameType,
+    types.CodeType,
+)
+
+
+def rss() -> int:
+    """Current resident set size of the process in bytes.
+
+    Read from /proc on Linux, falls back to the peak RSS elsewhere.
+    """
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return peak_rss()
+
+
+def peak_rss() -> int:
+    """Peak resident set size of the process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def deep_size(obj: Any, seen: Union[set[int], None] = None) -> int:
+    """Measures an object and everything it references.
+
+    numpy arrays and pandas frames report their buffers. Objects whose id is
+    in `seen` are skipped and every object measured is added to it, so
+    measuring several objects with the same set counts shared data once.
+
+    Args:
+        obj (Any): object to measure.
+        seen (Union[set[int], None], optional): ids already counted.
+            Defaults to None.
+
+    Returns:
+        int: size in bytes.
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIP_TYPES):
+            continue
+        seen.add(id(item))
+        if isinstance(item, np.ndarray):
+            size += sys.getsizeof(item) + (item.nbytes if item.base is None else 0)
+            continue
+        if isinstance(item, (pd.DataFrame, pd.Series)):
+            size += int(item.memory_usage(deep=True).sum())
+            continue
+        size += sys.getsizeof(item)
+        stack.extend(gc.get_referents(item))
+    return size
+
+
+def registry_sizes(
+    registry: datasets.Registry, extra: Union[dict[str, Any], None] = None
+) -> dict[str, int]:
+    """Deep size of every object loaded by the registry.
+
+    Objects are measured in order and shared data is counted only for the
+    first object referencing it, e.g. the group views do not count the member
+    graph again.
+
+    Args:
+        registry (datasets.Registry): registry to measure.
+        extra (Union[dict[str, Any], None], optional): other named objects to
+            measure, e.g. the app's data frames. Defaults to None.
+
+    Returns:
+        dict[str, int]: object name to exclusive deep size in bytes.
+    """
+    named = {
+        "member_graph": registry.base,
+        "adjacency": registry.adjacency,
+        "search_index": registry.search_index,
+        "journals": registry.journals,
+        "node_keys": registry.node_keys,
+    }
+    for key, dataset in registry.datasets.items():
+        named[f"{key}.graph"] = dataset.graph
+        for name, value in vars(dataset).items():
+            if name not in ("config", "registry", "graph"):
+                named[f"{key}.{name}"] = value
+    named.update(extra or {})
+    seen: set[int] = set()
+    # the registry and the datasets themselves are only containers
+    seen.update(id(obj) for obj in (registry, *registry.datasets.values()))
+    return {name: deep_size(obj, seen) for name, obj in named.items()}
+
+
+def cache_occupancy(registry: datasets.Registry) -> dict[str, Any]:
+    """Which lazily loaded caches are filled.
+
+    Args:
+        registry (datasets.Registry): registry to inspect.
+
+    Returns:
+        dict[str, Any]: loaded cached properties of every dataset, and the
+        hit/miss counts of the file digest and team figure caches.
+    """
+    cached = {
+        name
+        for name, value in vars(datasets.Dataset).items()
+        if hasattr(value, "attrname")
+    }
+    return {
+        "datasets": {
+            key: sorted(name for name in cached if name in vars(dataset))
+            for key, dataset in registry.datasets.items()
+        },
+        "file_digest": lru_info(pipeline._file_digest),
+        "team_figure": lru_info(registry.team_figure),
+    }
+
+
+def lru_info(cached: Any) -> dict[str, int]:
+    """Hit/miss counts and size of a functools.lru_cache."""
+    info = cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+def top_stats(stats: Iterable[tracemalloc.StatisticDiff], limit: int) -> list[dict]:
+    """Formats tracemalloc statistics as json rows."""
+    rows = []
+    for stat in list(stats)[:limit]:
+        frame = stat.traceback[0]
+        rows.append(
+            {
+                "where": f"{frame.filename}:{frame.lineno}",
+                "size": stat.size,
+                "count": stat.count,
+                "size_diff": getattr(stat, "size_diff", None),
+                "count_diff": getattr(stat, "count_diff", None),
+            }
+        )
+    return rows
+
+
+class MemoryMonitor:
+    """Samples RSS in the background and diffs tracemalloc snapshots."""
+
+    def __init__(self, interval: float = RSS_INTERVAL, trace: bool = True):
+        self.interval = interval
+        self.history = collections.deque(maxlen=RSS_HISTORY)
+        self.requests = collections.deque(maxlen=RSS_HISTORY)
+        self.lock = threading.Lock()
+        self.snapshot = None
+        if trace and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.sample()
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            self.sample()
+
+    def sample(self):
+        """Records the current RSS."""
+        with self.lock:
+            self.history.append((time.time(), rss()))
+
+    def record_request(self, path: str, before: int, after: int):
+        """Records the RSS change over one request."""
+        with self.lock:
+            self.requests.append(
+                {
+                    "time": time.time(),
+                    "path": path,
+                    "rss": after,
+                    "delta": after - before,
+                }
+            )
+
+    def diff(self, limit: int = TOP_STATS) -> dict:
+        """Compares a new tracemalloc snapshot with the previous one.
+
+        The first call compares against an empty baseline.
+
+        Args:
+            limit (int, optional): rows returned. Defaults to TOP_STATS.
+
+        Returns:
+            dict: traced memory totals and the allocation sites that grew most.
+        """
+        if not tracemalloc.is_tracing():
+            return {"error": "tracemalloc is not tracing"}
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        with self.lock:
+            previous, self.snapshot = self.snapshot, snapshot
+        if previous is None:
+            stats = snapshot.statistics("lineno")
+        else:
+            stats = snapshot.compare_to(previous, "lineno")
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "traced": current,
+            "traced_peak": peak,
+            "since_previous": previous is not None,
+            "top": top_stats(stats, limit),
+        }
+
+    def report(self) -> dict:
+        """RSS now, at peak and over time, with per-request changes."""
+        with self.lock:
+            return {
+                "rss": rss(),
+                "peak_rss": peak_rss(),
+                "pid": os.getpid(),
+                "history": [{"time": t, "rss": r} for t, r in self.history],
+                "requests": list(self.requests),
+            }
+
+
+def make_blueprint(
+    registry: datasets.Registry,
+    monitor: MemoryMonitor,
+    extra: Union[dict[str, Any], None] = None,
+) -> Blueprint:
+    """Creates the `/debug/memory` routes and per-request RSS tracking.
+
+    Routes:
+        /debug/memory           RSS history, per-request deltas, cache occupancy
+        /debug/memory?deep=1    adds the deep size of every loaded object (slow)
+        /debug/memory/diff      tracemalloc growth since the previous diff
+
+    Args:
+        registry (datasets.Registry): registry served by the app.
+        monitor (MemoryMonitor): monitor of this process.
+        extra (Union[dict[str, Any], None], optional): other named objects to
+            measure. Defaults to None.
+
+    Returns:
+        Blueprint: blueprint to register on the Flask server.
+    """
+    debug = Blueprint("memory", __name__, url_prefix="/debug/memory")
+    local = threading.local()
+
+    @debug.before_app_request
+    def rss_before():
+        local.rss = rss()
+
+    @debug.after_app_request
+    def rss_after(response):
+        if not request.path.startswith("/debug/"):
+            monitor.record_request(request.path, getattr(local, "rss", 0), rss())
+        return response
+
+    @debug.get("")
+    def memory_report():
+        report = monitor.report()
+        report["caches"] = cache_occupancy(registry)
+        if request.args.get("deep"):
+            sizes = registry_sizes(registry, extra)
+            report["deep_sizes"] = [
+                {"name": name, "size": size}
+                for name, size in sorted(sizes.items(), key=lambda item: -item[1])
+            ]
+        return jsonify(report)
+
+    @debug.get("/diff")
+    def memory_diff():
+        return jsonify(monitor.diff(request.args.get("limit", TOP_STATS, type=int)))
+
+    return debug
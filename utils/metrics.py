@@ -0,0 +1,32 @@
+"""Network metrics of a group, computed by the build and served as json."""
+
+import networkx as nx
+
+
+def group_metrics(graph: nx.Graph, members: set[str]) -> dict:
+    """Summarizes a group's network and each member's place in it.
+
+    Args:
+        graph (nx.Graph): group view of the base graph.
+        members (set[str]): node names of the group's scholars.
+
+    Returns:
+        dict: graph level counts plus degree, weighted degree (shared
+        publications) and clustering coefficient of every member.
+    """
+    members = sorted(members)
+    clustering = nx.clustering(graph, members)
+    return {
+        "nodes": graph.number_of_nodes(),
+        "edges": graph.number_of_edges(),
+        "density": nx.density(graph),
+        "components": nx.number_connected_components(graph),
+        "members": {
+            member: {
+                "degree": graph.degree(member),
+                "weighted_degree": graph.degree(member, weight="weight"),
+                "clustering": clustering[member],
+            }
+            for member in members
+        },
+    }
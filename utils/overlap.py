@@ -0,0 +1,94 @@
+"""Shared coauthor matrix of a group's scholars.
+
+With A the binary co-authorship adjacency matrix and A_s its rows for the
+group's scholars, A_s @ A_s.T counts, for every pair of scholars, the coauthors
+they have in common. The build computes it once per group as a sparse product.
+"""
+
+from typing import Union
+
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+
+
+class Overlap:
+    """Scholar by scholar shared coauthor counts."""
+
+    def __init__(self, names: list[str], matrix: sp.csr_matrix):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.matrix = matrix
+
+    @classmethod
+    def from_graph(cls, graph: nx.Graph, members: set[str]) -> "Overlap":
+        """Computes the shared coauthor counts of the members.
+
+        Args:
+            graph (nx.Graph): base graph.
+            members (set[str]): node names of the group's scholars.
+
+        Returns:
+            Overlap: the scholars' overlap, the diagonal is left empty.
+        """
+        nodes = list(graph.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        names = sorted(members)
+        adjacency = nx.to_scipy_sparse_array(
+            graph, nodelist=nodes, weight=None, dtype=np.int32, format="csr"
+        )
+        rows = sp.csr_matrix(adjacency[[index[name] for name in names]])
+        matrix = (rows @ rows.T).tocsr()
+        matrix.setdiag(0)
+        matrix.eliminate_zeros()
+        return cls(names, matrix)
+
+    def save(self, fpath: str):
+        """Saves the names and the csr arrays of the matrix.
+
+        Args:
+            fpath (str): destination .npz file.
+        """
+        np.savez_compressed(
+            fpath,
+            names=np.array(self.names),
+            data=self.matrix.data,
+            indices=self.matrix.indices,
+            indptr=self.matrix.indptr,
+            shape=np.array(self.matrix.shape),
+        )
+
+    @classmethod
+    def load(cls, fpath: str) -> "Overlap":
+        """Loads an overlap saved by `Overlap.save`.
+
+        Args:
+            fpath (str): source .npz file.
+
+        Returns:
+            Overlap: the loaded overlap.
+        """
+        with np.load(fpath) as data:
+            matrix = sp.csr_matrix(
+                (data["data"], data["indices"], data["indptr"]),
+                shape=tuple(data["shape"]),
+            )
+            return cls(data["names"].tolist(), matrix)
+
+    def top(self, name: str, limit: Union[int, None] = 10) -> list[tuple[str, int]]:
+        """Finds the scholars sharing the most coauthors with one scholar.
+
+        Args:
+            name (str): node name of the scholar.
+            limit (Union[int, None], optional): maximum colleagues returned.
+                Defaults to 10.
+
+        Returns:
+            list[tuple[str, int]]: colleague and number of shared coauthors,
+            most shared first.
+        """
+        if name not in self.index:
+            return []
+        row = self.matrix.getrow(self.index[name])
+        order = np.argsort(-row.data, kind="stable")[:limit]
+        return [(self.names[row.indices[i]], int(row.data[i])) for i in order]
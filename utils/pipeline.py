@@ -0,0 +1,113 @@
+"""Content-addressed stage cache for the data build.
+
+Every stage run is keyed by a hash of its name, version, parameters, input
+file contents and the keys of the stages it depends on. A stage whose key
+already has an output directory is skipped.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from typing import Any, Callable, Union
+
+CACHE_DIR = ".build"
+
+
+@lru_cache(maxsize=None)
+def _file_digest(fpath: str, mtime_ns: int, size: int) -> str:
+    digest = hashlib.sha256()
+    with open(fpath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_digest(fpath: str) -> str:
+    """Hashes a file's contents, memoized on its modification time and size.
+
+    Args:
+        fpath (str): file to hash.
+
+    Returns:
+        str: hex sha256 of the file, or "missing" if it does not exist.
+    """
+    if not os.path.exists(fpath):
+        return "missing"
+    stat = os.stat(fpath)
+    return _file_digest(fpath, stat.st_mtime_ns, stat.st_size)
+
+
+class StageCache:
+    """Stores stage outputs as directories named by their content key."""
+
+    def __init__(self, root: str = CACHE_DIR, force: bool = False):
+        self.root = root
+        self.force = force
+
+    def key(
+        self,
+        stage: str,
+        version: int,
+        params: Union[dict[str, Any], None] = None,
+        inputs: tuple[str, ...] = (),
+        upstream: tuple[str, ...] = (),
+    ) -> str:
+        """Computes the content key of a stage run.
+
+        Args:
+            stage (str): stage name.
+            version (int): bumped whenever the stage's code changes its output.
+            params (Union[dict[str, Any], None], optional): parameters of the run.
+                Defaults to None.
+            inputs (tuple[str, ...], optional): files read by the stage. Defaults to ().
+            upstream (tuple[str, ...], optional): keys of the stages it depends on.
+                Defaults to ().
+
+        Returns:
+            str: hex sha256 key.
+        """
+        payload = {
+            "stage": stage,
+            "version": version,
+            "params": params or {},
+            "inputs": {fpath: file_digest(fpath) for fpath in inputs},
+            "upstream": list(upstream),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def path(self, stage: str, key: str) -> str:
+        """Output directory of a stage run."""
+        return os.path.join(self.root, stage, key)
+
+    def run(self, stage: str, key: str, fn: Callable[..., None], *args) -> bool:
+        """Runs a stage unless its output already exists.
+
+        `fn` is called with a temporary output directory followed by `args`,
+        and the directory is moved into place only once `fn` returns.
+
+        Args:
+            stage (str): stage name.
+            key (str): content key from `StageCache.key`.
+            fn (Callable[..., None]): writes the stage's output files.
+
+        Returns:
+            bool: True if the stage ran, False if it was skipped.
+        """
+        out = self.path(stage, key)
+        if os.path.isdir(out) and not self.force:
+            return False
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=os.path.dirname(out), prefix=".tmp-")
+        try:
+            fn(tmp, *args)
+            if os.path.isdir(out):
+                shutil.rmtree(out)
+            os.replace(tmp, out)
+        finally:
+            if os.path.isdir(tmp):
+                shutil.rmtree(tmp)
+        return True
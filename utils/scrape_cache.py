@@ -0,0 +1,117 @@
+"""Per-author cache of scraped Google Scholar publications.
+
+Each scholar's publications are stored in `data/scrape-cache/<id>.json` with
+a fingerprint of their profile's first page (the newest titles and whether
+there are more pages). A rerun compares a fresh fingerprint against the
+stored one and only re-scrapes the scholars whose profile changed.
+"""
+
+import json
+import os
+import time
+from typing import Union
+
+SCRAPE_CACHE_DIR = "data/scrape-cache"
+ENCODING = "utf-8-sig"
+
+
+class ScrapeCache:
+    """Scraped publications and profile fingerprints keyed by scholar id."""
+
+    def __init__(self, root: str = SCRAPE_CACHE_DIR):
+        self.root = root
+
+    def path(self, scholar_id: str) -> str:
+        """File of a scholar's cache entry."""
+        return os.path.join(self.root, f"{scholar_id}.json")
+
+    def get(self, scholar_id: str) -> Union[dict, None]:
+        """Loads a scholar's cache entry.
+
+        Args:
+            scholar_id (str): Google Scholar ID.
+
+        Returns:
+            Union[dict, None]: entry with `name`, `fingerprint`, `scraped_at`
+            and `records`, or None if the scholar was never scraped.
+        """
+        try:
+            with open(self.path(scholar_id), "r", encoding=ENCODING) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def put(
+        self,
+        scholar_id: str,
+        name: str,
+        fingerprint: dict,
+        records: list[dict[str, str]],
+    ):
+        """Stores a scholar's freshly scraped publications.
+
+        Args:
+            scholar_id (str): Google Scholar ID.
+            name (str): scholar name.
+            fingerprint (dict): profile fingerprint at the time of the scrape.
+            records (list[dict[str, str]]): scraped publications.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        entry = {
+            "id": scholar_id,
+            "name": name,
+            "fingerprint": fingerprint,
+            "scraped_at": time.time(),
+            "records": records,
+        }
+        tmp = f"{self.path(scholar_id)}.tmp"
+        with open(tmp, "w", encoding=ENCODING) as f:
+            json.dump(entry, f, indent=4, sort_keys=True)
+        os.replace(tmp, self.path(scholar_id))
+
+    def is_fresh(
+        self, scholar_id: str, fingerprint: dict, max_age: Union[float, None] = None
+    ) -> bool:
+        """Whether a scholar's cache entry still matches their profile.
+
+        Args:
+            scholar_id (str): Google Scholar ID.
+            fingerprint (dict): current profile fingerprint.
+            max_age (Union[float, None], optional): seconds after which an entry
+                is re-scraped regardless. Defaults to None.
+
+        Returns:
+            bool: True if the scholar can be skipped.
+        """
+        entry = self.get(scholar_id)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return False
+        return max_age is None or time.time() - entry["scraped_at"] < max_age
+
+    def merge(self, scholar_ids: list[str], fpath: str) -> list[str]:
+        """Writes the cached publications of every scholar to one file.
+
+        The file is only written if every scholar has a cache entry, so a
+        failed scrape never drops publications from the output.
+
+        Args:
+            scholar_ids (list[str]): scholars to include, in output order.
+            fpath (str): destination json file.
+
+        Returns:
+            list[str]: ids of the scholars missing from the cache, empty if
+            the file was written.
+        """
+        records = []
+        missing = []
+        for scholar_id in dict.fromkeys(scholar_ids):
+            entry = self.get(scholar_id)
+            if entry is None:
+                missing.append(scholar_id)
+            else:
+                records.extend(entry["records"])
+        if missing:
+            return missing
+        with open(fpath, "w", encoding=ENCODING) as f:
+            json.dump(records, f, indent=4, sort_keys=True)
+        return []
@@ -0,0 +1,47 @@
+"""Typeahead search over node names.
+
+Names are indexed in a sorted array of lowercase keys, one key per word a name
+can be searched from ("chris delcher" and "delcher"), so a prefix lookup is two
+binary searches and only the top matches by degree are returned.
+"""
+
+import bisect
+import heapq
+from typing import Iterable
+
+SEARCH_LIMIT = 20
+
+
+class PrefixIndex:
+    """Sorted-array prefix index ranking matches by a score."""
+
+    def __init__(self, names: Iterable[str], scores: dict[str, int]):
+        entries = []
+        for name in names:
+            words = name.casefold().split()
+            for i in range(len(words)):
+                entries.append((" ".join(words[i:]), name))
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.names = [name for _, name in entries]
+        self.scores = scores
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> list[str]:
+        """Finds the names with a word starting with the query.
+
+        Args:
+            query (str): typed text.
+            limit (int, optional): maximum matches returned. Defaults to SEARCH_LIMIT.
+
+        Returns:
+            list[str]: best scoring matches, highest first.
+        """
+        prefix = " ".join(query.casefold().split())
+        if not prefix:
+            return []
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\uffff", lo)
+        matches = set(self.names[lo:hi])
+        return heapq.nsmallest(
+            limit, matches, key=lambda name: (-self.scores.get(name, 0), name)
+        )
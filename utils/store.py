@@ -0,0 +1,103 @@
+"""Content-addressed store of pre-rendered author figures.
+
+Each ego (one author) or pair (two authors) figure is saved as gzipped json
+under a hash of the authors, the number of hops, the neighborhood budgets and
+the base graph's digest, so rebuilding the graph invalidates every figure
+without having to clear the store. Pairs are stored once, with the authors
+sorted, and re-titled when served.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Iterable, Union
+
+import plotly.graph_objects as go
+
+from utils import adjacency, graphing
+
+FIGURE_STORE_DIR = "data/figures"
+STORE_VERSION = 1
+
+
+class FigureStore:
+    """Gzipped figures of author neighborhoods keyed by their content."""
+
+    def __init__(self, root: str, graph_digest: str):
+        self.root = root
+        self.graph_digest = graph_digest
+
+    def key(self, authors: Iterable[str], depth: int = 1) -> str:
+        """Computes the content key of an author figure.
+
+        Args:
+            authors (Iterable[str]): node names of the focused authors, in any order.
+            depth (int, optional): number of coauthor hops. Defaults to 1.
+
+        Returns:
+            str: hex sha256 key.
+        """
+        payload = {
+            "version": STORE_VERSION,
+            "graph": self.graph_digest,
+            "authors": sorted(set(authors)),
+            "depth": depth,
+            "max_nodes": adjacency.MAX_NODES,
+            "max_edges": adjacency.MAX_EDGES,
+            "compact": graphing.COMPACT,
+            "typed_arrays": graphing.TYPED_ARRAYS,
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def path(self, key: str) -> str:
+        """File of a stored figure, sharded by the key's first two characters."""
+        return os.path.join(self.root, key[:2], f"{key}.json.gz")
+
+    def get(
+        self, authors: Iterable[str], depth: int = 1
+    ) -> Union[tuple[dict, str], None]:
+        """Reads a stored figure.
+
+        Args:
+            authors (Iterable[str]): node names of the focused authors.
+            depth (int, optional): number of coauthor hops. Defaults to 1.
+
+        Returns:
+            Union[tuple[dict, str], None]: figure dict and the neighborhood
+            details of its title, or None if it was never rendered.
+        """
+        try:
+            with gzip.open(self.path(self.key(authors, depth)), "rt") as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        return record["figure"], record["details"]
+
+    def put(self, authors: Iterable[str], depth: int, figure: go.Figure, details: str):
+        """Writes a figure, replacing the file atomically.
+
+        Args:
+            authors (Iterable[str]): node names of the focused authors.
+            depth (int): number of coauthor hops.
+            figure (go.Figure): rendered figure.
+            details (str): neighborhood details of the figure's title.
+        """
+        fpath = self.path(self.key(authors, depth))
+        os.makedirs(os.path.dirname(fpath), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(fpath), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt") as f:
+                f.write(
+                    f'{{"details": {json.dumps(details)}, "figure": {graphing.figure_json(figure)}}}'
+                )
+            os.replace(tmp, fpath)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def __contains__(self, item: tuple[Iterable[str], int]) -> bool:
+        authors, depth = item
+        return os.path.exists(self.path(self.key(authors, depth)))
@@ -1,62 +1,76 @@
+from typing import Union
+
 import networkx as nx
 import pickle
 
 
-def save_graph(connections: list[tuple[str, str]]):
-    """Utility function to save a networkx graph from connection pairs.
+def parse_name(name: str) -> str:
+    """Extracts first and last parts of a name.
+
+    This could be first and last name or any variation.
 
     Args:
-        connections (list[tuple[str, str]]): A list of connection pairs.
+        name (str): String name to be parsed
+
+    Returns:
+        str: Extracted 2-part name.
     """
-    G = nx.Graph()
-    G.add_edges_from(connections)
-    positions = nx.spring_layout(G)
-    with open("data/cop-graph.pkl", "wb") as f:
-        pickle.dump(G, f)
-    with open("data/cop-graph-positions.pkl", "wb") as f:
-        pickle.dump(positions, f)
+    parts = name.split()
+    parsed = f"{parts[0]} {parts[-1]}"
+    return parsed
 
 
-def load_graph_from_files() -> tuple[nx.Graph, nx.layout]:
-    """Utility function to load a networkx graph from files.
+def save_graph(graph: nx.Graph, fpath: str = "data/full_graph.pkl"):
+    """Utility function to save a networkx graph to file.
 
-    Returns:
-        tuple[nx.Graph, nx.layout]: Networkx graph and spring_layout positions.
+    Args:
+        graph (nx.Graph): Graph to save.
+        fpath (str, optional): Destination file. Defaults to "data/full_graph.pkl".
     """
-    with open("data/cop-graph.pkl", "rb") as f:
-        g = pickle.load(f)
-    with open("data/cop-graph-positions.pkl", "rb") as f:
-        positions = pickle.load(f)
-    return g, positions
+    with open(fpath, "wb") as f:
+        pickle.dump(graph, f)
+
 
+def load_graph(fpath: str = "data/full_graph.pkl") -> nx.Graph:
+    """Utility function to load a networkx graph from file.
 
-def save_ipop_graph(connections: list[tuple[str, str]]):
-    """Utility function to save a networkx graph from connection pairs.
+    Args:
+        fpath (str, optional): Source file. Defaults to "data/full_graph.pkl".
+
+    Returns:
+        nx.Graph: Networkx graph.
+    """
+    with open(fpath, "rb") as f:
+        return pickle.load(f)
 
-    Should be used ONLY on IPOP authors connections.
+
+def save_positions(
+    graph: nx.Graph, fpath: str, seed: Union[int, None] = None
+) -> nx.layout:
+    """Utility function to compute and save spring_layout positions of a graph.
 
     Args:
-        connections (list[tuple[str, str]]): A list of connection pairs.
+        graph (nx.Graph): Graph (or graph view) to lay out.
+        fpath (str): Destination file.
+        seed (Union[int, None], optional): spring_layout seed. Defaults to None.
+
+    Returns:
+        nx.layout: The computed spring_layout positions.
     """
-    G = nx.Graph()
-    G.add_edges_from(connections)
-    positions = nx.spring_layout(G)
-    with open("data/ipop-graph.pkl", "wb") as f:
-        pickle.dump(G, f)
-    with open("data/ipop-graph-positions.pkl", "wb") as f:
+    positions = nx.spring_layout(graph, seed=seed)
+    with open(fpath, "wb") as f:
         pickle.dump(positions, f)
+    return positions
 
 
-def load_ipop_graph_from_files() -> tuple[nx.Graph, nx.layout]:
-    """Utility function to load a networkx graph from files.
+def load_positions(fpath: str) -> nx.layout:
+    """Utility function to load spring_layout positions from file.
 
-    Should be used ONLY on IPOP authors connections.
+    Args:
+        fpath (str): Source file.
 
     Returns:
-        tuple[nx.Graph, nx.layout]: Networkx graph and spring_layout positions.
+        nx.layout: spring_layout positions.
     """
-    with open("data/ipop-graph.pkl", "rb") as f:
-        g = pickle.load(f)
-    with open("data/ipop-graph-positions.pkl", "rb") as f:
-        positions = pickle.load(f)
-    return g, positions
\ No newline at end of file
+    with open(fpath, "rb") as f:
+        return pickle.load(f)